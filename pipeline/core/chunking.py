@@ -4,19 +4,34 @@ This module implements various strategies for splitting documents
 into manageable chunks while preserving structure and context.
 """
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple, Set, Union, TypeVar, Sequence, cast
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Set, Union, TypeVar, Sequence, cast
 from enum import Enum, auto
 from datetime import datetime
 from pathlib import Path
+import io
 import logging
+import os
+import tarfile
+import threading
 import re
+import sys
 import json
 import yaml
+from collections import Counter, defaultdict, deque
 from collections.abc import Mapping
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import accumulate, count, repeat
 
 from pipeline.models.base import DocumentModel, ContentElement
 
+# Prefer the libyaml emitter; the pure-Python one dominates save time
+try:
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
 # Type aliases to improve type checking
@@ -26,22 +41,51 @@ ContentElementList = List[Union[Dict[str, Any], 'ContentElement']]
 ContentItem = Union[Dict[str, Any], ContentElement]
 ContentList = Sequence[ContentItem]
 
-def ensure_dict(element: Any) -> Dict[str, Any]:
-    """Convert ContentElement to Dict if needed."""
+def _dict_identity(element: Dict[str, Any]) -> Dict[str, Any]:
+    return element
+
+def _dict_from_method(element: Any) -> Dict[str, Any]:
+    return element.to_dict()
+
+def _dict_from_vars(element: Any) -> Dict[str, Any]:
+    return {k: v for k, v in element.__dict__.items() if not k.startswith('_')}
+
+def _dict_from_attrs(element: Any) -> Dict[str, Any]:
+    return {attr: getattr(element, attr) for attr in dir(element)
+            if not attr.startswith('_') and not callable(getattr(element, attr))}
+
+# Converter for each element type seen so far, so the introspection that
+# picks one runs once per type rather than once per element
+_DICT_CONVERTERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {dict: _dict_identity}
+
+def _dict_converter(element: Any) -> Callable[[Any], Dict[str, Any]]:
+    """Pick the conversion to dict for an element's type."""
     if isinstance(element, dict):
-        return element
+        return _dict_identity
     if hasattr(element, 'to_dict') and callable(getattr(element, 'to_dict')):
-        return element.to_dict()
+        return _dict_from_method
     if hasattr(element, '__dict__'):
-        return {k: v for k, v in element.__dict__.items() if not k.startswith('_')}
+        return _dict_from_vars
     # Fallback: try to use attribute access
-    return {attr: getattr(element, attr) for attr in dir(element) 
-            if not attr.startswith('_') and not callable(getattr(element, attr))}
+    return _dict_from_attrs
+
+def ensure_dict(element: Any) -> Dict[str, Any]:
+    """Convert ContentElement to Dict if needed."""
+    converter = _DICT_CONVERTERS.get(type(element))
+    if converter is None:
+        converter = _DICT_CONVERTERS[type(element)] = _dict_converter(element)
+    return converter(element)
 
 def ensure_dict_list(elements: Sequence[Any]) -> List[Dict[str, Any]]:
-    """Convert a list of ContentElements to a list of dicts."""
+    """Convert a list of ContentElements to a list of dicts.
+    
+    The result is always a new list, since chunks mutate their content.
+    Content that is already all plain dicts is copied in one step.
+    """
     if not elements:
         return []
+    if set(map(type, elements)) == {dict}:
+        return list(elements)
     return [ensure_dict(elem) for elem in elements]
 
 def ensure_content_element(element: Union[Dict[str, Any], ContentElement]) -> ContentElement:
@@ -59,29 +103,332 @@ def ensure_content_element_list(elements: Sequence[Union[Dict[str, Any], Content
         return []
     return [ensure_content_element(elem) for elem in elements]
 
-@dataclass
+_WORD_RE = re.compile(r'\S+')
+
+# Cross-references to figures, tables and sections. The label group that
+# matched gives the reference type and 'num' captures the referenced number.
+_REF_RE = re.compile(
+    r'(?:(?P<fig>Figure|Fig\.?)|(?P<tbl>Table)|(?P<sec>Section))\s+(?P<num>\d+(?:\.\d+)*)'
+)
+
+# Capitalized words and runs of them, taken as key phrases
+_PHRASE_RE = re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)')
+
+# Words ignored when extracting topics
+_STOP_WORDS = frozenset((
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'
+))
+
+# Element types that carry countable text
+_TEXT_TYPES = frozenset(('text', 'paragraph'))
+
+# Element types a chunk is best split just before
+_SPLIT_BEFORE_TYPES = frozenset(('heading', 'section_break'))
+
+# Break hint queued after sentence-ending elements by fixed-size chunking.
+# It marks where a chunk may end and is dropped before chunks are built.
+_PARAGRAPH_END = {'type': 'paragraph_end'}
+
+# Characters that end a sentence
+_SENT_END = ('.', '!', '?')
+
+# Maps every sentence terminator to '.' so text splits on one character
+_SENT_SPLIT_TABLE = str.maketrans('!?', '..')
+
+def _split_text_by_words(text: str, max_words: int) -> List[Tuple[str, int]]:
+    """Cut text into slices of at most max_words words.
+
+    Slices are taken directly from the original string at word offsets, so
+    no intermediate word list is built and no parts are re-joined.
+    """
+    parts = []
+    start = end = 0
+    count = 0
+    for match in _WORD_RE.finditer(text):
+        if count == 0:
+            start = match.start()
+        end = match.end()
+        count += 1
+        if count == max_words:
+            parts.append((text[start:end], count))
+            count = 0
+    if count:
+        parts.append((text[start:end], count))
+    return parts
+
+def _normalize_text(text: str) -> str:
+    """Normalize text for comparison."""
+    return text.lower().strip()
+
+def _element_word_count(element: Dict[str, Any]) -> int:
+    """Get the word count of an element's text, cached on the element."""
+    if '_wc' in element:
+        return element['_wc']
+    count = element['_wc'] = len(element.get('text', '').split())
+    return count
+
+def _element_ends_sentence(element: Dict[str, Any]) -> bool:
+    """Check whether a text element ends a sentence, cached on the element."""
+    if '_ends_sentence' in element:
+        return element['_ends_sentence']
+    ends = element['_ends_sentence'] = (
+        element.get('type') in _TEXT_TYPES and
+        element.get('text', '').rstrip().endswith(_SENT_END)
+    )
+    return ends
+
+# Entries, and characters of key text, kept in each ContentPatternDetector
+# result cache. The size bound keeps a few huge blocks from pinning memory.
+_DETECTOR_CACHE_SIZE = 2048
+_DETECTOR_CACHE_CHARS = 1 << 21
+
+class _TextCache:
+    """FIFO cache of results keyed by text, bounded by count and total size.
+    
+    Detectors are shared across threads, so stores and evictions are made
+    under a lock; lookups are plain dict reads. Texts larger than the whole
+    budget are not cached.
+    """
+    __slots__ = ('_entries', '_chars', '_lock')
+    
+    def __init__(self) -> None:
+        self._entries: Dict[str, Any] = {}
+        self._chars = 0
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, text: str) -> Any:
+        return self._entries.get(text)
+    
+    def put(self, text: str, value: Any) -> None:
+        """Store a value, evicting the oldest entries to make room."""
+        size = len(text)
+        if size > _DETECTOR_CACHE_CHARS:
+            return
+        entries = self._entries
+        with self._lock:
+            if text in entries:
+                entries[text] = value
+                return
+            while entries and (len(entries) >= _DETECTOR_CACHE_SIZE
+                               or self._chars + size > _DETECTOR_CACHE_CHARS):
+                oldest = next(iter(entries))
+                if entries.pop(oldest, None) is not None:
+                    self._chars -= len(oldest)
+            entries[text] = value
+            self._chars += size
+
+# Characters at each end of a chunk compared by detect_narrative_flow
+_FLOW_WINDOW = 200
+
+# Words of four or more letters, taken as key terms
+_TERM_RE = re.compile(r'\b[A-Za-z]{4,}\b')
+
+def _extract_key_terms(text: str, start: int = 0, end: int = sys.maxsize) -> frozenset:
+    """Get the lowercased key terms of text[start:end] without slicing it.
+    
+    A word cut by start is skipped, as the scan sees the text before it.
+    """
+    return frozenset(match.group().lower() for match in _TERM_RE.finditer(text, start, end))
+
+def _overlap_score(a: frozenset, b: frozenset) -> float:
+    """Jaccard overlap of two term sets; 0.0 when both are empty."""
+    if not a or not b:
+        return 0.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+# Keys under which per-element values are cached on element dicts
+_ELEMENT_CACHE_KEYS = frozenset(('_wc', '_norm', '_ends_sentence'))
+
+def _strip_element_caches(element: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop the cached values stored on an element so it can be serialized."""
+    if not _ELEMENT_CACHE_KEYS.isdisjoint(element):
+        return {key: value for key, value in element.items() if key not in _ELEMENT_CACHE_KEYS}
+    return element
+
+def _baeza_yates_intersect(a: Sequence[Any], b: Sequence[Any]) -> List[Any]:
+    """Intersect two sorted sequences of unique values.
+    
+    The median of the shorter side is bisected into the longer one and both
+    halves are intersected the same way, which beats building hash sets
+    when one side is much smaller than the other. The result is sorted.
+    """
+    result = []
+    
+    def intersect(a, a_lo, a_hi, b, b_lo, b_hi):
+        if a_lo >= a_hi or b_lo >= b_hi:
+            return
+        if a_hi - a_lo > b_hi - b_lo:
+            a, a_lo, a_hi, b, b_lo, b_hi = b, b_lo, b_hi, a, a_lo, a_hi
+        mid = (a_lo + a_hi) // 2
+        value = a[mid]
+        pos = bisect_left(b, value, b_lo, b_hi)
+        intersect(a, a_lo, mid, b, b_lo, pos)
+        found = pos < b_hi and b[pos] == value
+        if found:
+            result.append(value)
+        intersect(a, mid + 1, a_hi, b, pos + found, b_hi)
+    
+    intersect(a, 0, len(a), b, 0, len(b))
+    return result
+
+def _sorted_targets(references: Dict[str, List[Dict[str, Any]]], kind: str) -> Tuple[str, ...]:
+    """Get the distinct targets of one kind of reference as a sorted tuple.
+    
+    Outgoing references are keyed by target; internal ones resolve both
+    their id and their target.
+    """
+    keys = ('target',) if kind == 'outgoing' else ('id', 'target')
+    return tuple(sorted({
+        str(ref[key]) for ref in references.get(kind, ()) for key in keys
+        if ref.get(key) is not None
+    }))
+
+def _target_continuity(outgoing: Sequence[str], resolved: Sequence[str]) -> float:
+    """Share of sorted outgoing targets found among sorted resolved targets."""
+    if not outgoing:
+        return 0.0
+    return len(_baeza_yates_intersect(outgoing, resolved)) / len(outgoing)
+
+def _join_text(elements: Sequence[Dict[str, Any]]) -> str:
+    """Join the text of all text and paragraph elements with single spaces."""
+    return ' '.join(
+        element.get('text', '')
+        for element in elements
+        if element.get('type') in _TEXT_TYPES
+    )
+
+def _element_norm_text(element: Dict[str, Any]) -> str:
+    """Get an element's normalized text, cached on the element.
+    
+    The text is interned so lookups against interned TOC titles compare
+    keys by identity.
+    """
+    if '_norm' in element:
+        return element['_norm']
+    norm = element['_norm'] = sys.intern(_normalize_text(element.get('text', '')))
+    return norm
+
+def _subtext_elem(base: Dict[str, Any], new_text: str) -> Dict[str, Any]:
+    """Create an element holding part of a larger element's text.
+
+    Every key of the base element except its text is carried over, so ids,
+    pages and metadata survive splitting and references to the element
+    still resolve. Values cached from the base element's text are dropped.
+    """
+    part = _strip_element_caches(base)
+    part = dict(part) if part is base else part
+    part['text'] = new_text
+    return part
+
 class ChunkBoundary:
-    """Represents a boundary between chunks with contextual information."""
-    start_pos: int
-    end_pos: int
-    context: Dict[str, Any]  # Preserves context across chunk boundary
-    heading_stack: List[Dict[str, str]]  # Current heading hierarchy
-    references: Dict[str, List[Dict[str, Any]]]  # Reference tracking
+    """Represents a boundary between chunks with contextual information.
+    
+    Parts split from the same chunk share its context and heading_stack
+    objects, and a merged chunk shares the heading_stack of its first part,
+    so both are treated as read-only once a boundary is created.
+    
+    References may be given directly, or as the source content together with
+    an extractor. In the latter case they are only extracted the first time
+    they are read, so boundaries whose references are never used skip the
+    extraction entirely.
+    """
+    __slots__ = ('start_pos', 'end_pos', 'context', 'heading_stack',
+                 '_references', '_refs_source', '_extractor')
+    
+    def __init__(self,
+                 start_pos: int,
+                 end_pos: int,
+                 context: Dict[str, Any],  # Preserves context across chunk boundary
+                 heading_stack: List[Dict[str, str]],  # Current heading hierarchy
+                 references: Optional[Dict[str, List[Dict[str, Any]]]] = None,  # Reference tracking
+                 _refs_source: Optional[Sequence[Dict[str, Any]]] = None,
+                 _extractor: Optional[Callable[[Sequence[Dict[str, Any]]], Dict[str, List[Dict[str, Any]]]]] = None):
+        self.start_pos = start_pos
+        self.end_pos = end_pos
+        self.context = context
+        self.heading_stack = heading_stack
+        if references is None and _extractor is None:
+            references = {}
+        self._references = references
+        self._refs_source = _refs_source
+        self._extractor = _extractor
+    
+    @property
+    def references(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the boundary references, extracting them on first access."""
+        if self._references is None:
+            self._references = self._extractor(self._refs_source)
+            self._refs_source = self._extractor = None
+        return self._references
+    
+    @references.setter
+    def references(self, value: Dict[str, List[Dict[str, Any]]]) -> None:
+        self._references = value
+        self._refs_source = self._extractor = None
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # Resolve pending references so the extractor is never pickled
+        self.references
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for slot, value in state.items():
+            setattr(self, slot, value)
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ChunkBoundary):
+            return NotImplemented
+        return (self.start_pos, self.end_pos, self.context, self.heading_stack, self.references) == \
+            (other.start_pos, other.end_pos, other.context, other.heading_stack, other.references)
+    
+    def __repr__(self) -> str:
+        return (f"ChunkBoundary(start_pos={self.start_pos!r}, end_pos={self.end_pos!r}, "
+                f"context={self.context!r}, heading_stack={self.heading_stack!r}, "
+                f"references={self.references!r})")
+
+class _ContentColumns:
+    """Per-element columns of a content list.
+    
+    Scans that only need element types, word counts, positions or sentence
+    ends read these parallel lists by index instead of making several dict
+    lookups per element. The content list itself is left untouched.
+    """
+    __slots__ = ('types', 'sizes', 'offsets', 'positions', 'ends_sentence', 'total')
+    
+    def __init__(self, content: Sequence[Dict[str, Any]]) -> None:
+        self.types = [elem.get('type') for elem in content]
+        self.sizes = [
+            _element_word_count(elem) if elem_type in _TEXT_TYPES else 0
+            for elem, elem_type in zip(content, self.types)
+        ]
+        # Word offset at which each element starts
+        self.offsets = [0, *accumulate(self.sizes)]
+        self.total = self.offsets.pop()
+        self.positions = [elem.get('position', 0) for elem in content]
+        self.ends_sentence = [_element_ends_sentence(elem) for elem in content]
 
 class ChunkMetadata:
     """Rich metadata for document chunks."""
+    __slots__ = ('chunk_id', 'sequence_num', 'start_page', 'end_page', 'section_title',
+                 'created_at', 'word_count', 'patterns', 'source_reference')
+    
     def __init__(self, 
                  chunk_id: str,
                  sequence_num: int,
                  start_page: Optional[int] = None,
                  end_page: Optional[int] = None,
-                 section_title: Optional[str] = None):
+                 section_title: Optional[str] = None,
+                 created_at: Optional[datetime] = None):
         self.chunk_id = chunk_id
         self.sequence_num = sequence_num
         self.start_page = start_page
         self.end_page = end_page
         self.section_title = section_title
-        self.created_at = datetime.now()
+        self.created_at = created_at or datetime.now()
         self.word_count = 0
         self.patterns = {}
         self.source_reference = {}
@@ -110,7 +457,9 @@ class ChunkMetadata:
             end_page=data.get('end_page'),
             section_title=data.get('section_title')
         )
-        metadata.created_at = datetime.fromisoformat(data.get('created_at', datetime.now().isoformat()))
+        created_at = data.get('created_at')
+        if created_at:
+            metadata.created_at = datetime.fromisoformat(created_at)
         metadata.word_count = data.get('word_count', 0)
         metadata.patterns = data.get('patterns', {})
         metadata.source_reference = data.get('source_reference', {})
@@ -118,46 +467,70 @@ class ChunkMetadata:
 
 class Chunk:
     """Represents a document chunk with content, boundary and metadata."""
+    __slots__ = ('content', 'boundary', 'metadata', '_size',
+                 '_content_version', '_size_version')
+    
     def __init__(self,
                  content: Sequence[Union[Dict[str, Any], ContentElement]],
                  boundary: ChunkBoundary,
                  metadata: ChunkMetadata,
-                 _size: Optional[int] = None):
-        # Convert content to ensure it's a list of dictionaries
-        self.content = ensure_dict_list(content)
+                 _size: Optional[int] = None,
+                 _already_dicts: bool = False):
+        # Convert content to ensure it's a list of dictionaries, unless the
+        # caller built it as a fresh list of dicts it hands over
+        self.content = content if _already_dicts else ensure_dict_list(content)
         self.boundary = boundary
         self.metadata = metadata
         self._size = _size
+        # The cached size is valid while its version matches the content's;
+        # mutators below bump the content version to invalidate it
+        self._content_version = 0
+        self._size_version = 0 if _size is not None else -1
 
     @property
     def size(self) -> int:
         """Get chunk size in words."""
-        # Debug size calculation
-        print(f"DEBUG: Getting size for chunk {self.metadata.chunk_id}, explicit size: {self._size}, metadata word_count: {self.metadata.word_count}")
-        
-        # Use explicitly set size as primary source of truth
-        if self._size is not None:
+        # Explicitly set or previously computed size for the current content
+        if self._size_version == self._content_version:
             return self._size
             
-        # Use metadata word count if available
-        if hasattr(self.metadata, 'word_count') and self.metadata.word_count > 0:
-            # Cache this value for future use
+        # Use metadata word count if available and the content is untouched
+        if self._content_version == 0 and self.metadata.word_count > 0:
             self._size = self.metadata.word_count
-            return self.metadata.word_count
+            self._size_version = self._content_version
+            return self._size
             
-        # Calculate size from content
-        content_size = sum(
-            len(elem.get('text', '').split())
-            for elem in self.content
-            if elem.get('type') in ['text', 'paragraph']
-        )
+        content_size = self._compute_size()
         
         # Cache the calculated size
         self._size = content_size
+        self._size_version = self._content_version
         # Also update metadata for consistency
         self.metadata.word_count = content_size
-        print(f"DEBUG: Calculated size {content_size} for chunk {self.metadata.chunk_id}")
         return content_size
+    
+    def _compute_size(self) -> int:
+        """Count the words of the chunk's text elements."""
+        return sum(
+            _element_word_count(elem)
+            for elem in self.content
+            if elem.get('type') in _TEXT_TYPES
+        )
+    
+    def pop_element(self, index: int = -1) -> Dict[str, Any]:
+        """Remove and return a content element, invalidating the cached size."""
+        # Resolve pending references while the boundary's source is unchanged
+        self.boundary.references
+        element = self.content.pop(index)
+        self._content_version += 1
+        return element
+    
+    def prepend_elements(self, elements: Sequence[Dict[str, Any]]) -> None:
+        """Insert elements ahead of the content, invalidating the cached size."""
+        if elements:
+            self.boundary.references
+            self.content = [*elements, *self.content]
+            self._content_version += 1
         
     def with_size(self, size: int) -> 'Chunk':
         """Create a new chunk with the specified size."""
@@ -171,7 +544,7 @@ class Chunk:
     def to_dict(self) -> Dict[str, Any]:
         """Convert chunk to dictionary."""
         return {
-            'content': self.content,
+            'content': [_strip_element_caches(elem) for elem in self.content],
             'boundary': {
                 'start_pos': self.boundary.start_pos,
                 'end_pos': self.boundary.end_pos,
@@ -208,11 +581,20 @@ class ChunkingStrategy(ABC):
     
     def __init__(self, config: Dict[str, Any]) -> None:
         self.config = config
+        self._track_refs = bool(config.get('track_references', True))
     
     @abstractmethod
     def split(self, document: DocumentModel) -> List['Chunk']:
         """Split document into chunks."""
         pass
+    
+    def split_iter(self, document: DocumentModel) -> Generator['Chunk', None, None]:
+        """Yield document chunks as they are produced.
+        
+        Strategies that can finalize chunks incrementally override this so
+        callers can consume chunks without holding the full list.
+        """
+        yield from self.split(document)
         
     def _split_large_chunk(self, chunk: Chunk, max_size: int) -> List['Chunk']:
         """Default implementation for splitting large chunks."""
@@ -228,19 +610,230 @@ class ContentPatternDetector:
         self.registry = create_default_registry()
         self._initialize_entity_patterns()
         self._initialize_semantic_patterns()
+        # Per-text results; the same blocks are analyzed repeatedly while
+        # scoring boundaries, so repeat calls are served from here
+        self._entity_cache = _TextCache()
+        self._density_cache = _TextCache()
+        self._chapter_cache = _TextCache()
+        self._probe_cache = _TextCache()
     
     def _initialize_entity_patterns(self) -> None:
         """Initialize entity extraction patterns."""
         self.entity_patterns = {}
+        self._entity_regex = self._compile_entity_regex()
         
     def _initialize_semantic_patterns(self) -> None:
         """Initialize semantic and structural patterns."""
         self.semantic_patterns = {}
         self.structure_patterns = {}
+    
+    def _compile_entity_regex(self) -> Optional[re.Pattern]:
+        """Combine all entity patterns into one alternation.
+        
+        Each entity type becomes a named group, so a single scan over the
+        text finds every entity and the matching type is read from the
+        match's last group.
+        """
+        if not self.entity_patterns:
+            return None
+        return re.compile('|'.join(
+            f"(?P<{name}>{getattr(pattern, 'pattern', pattern)})"
+            for name, pattern in self.entity_patterns.items()
+        ))
         
     def extract_entities(self, text: str) -> Dict[str, List[str]]:
         """Extract named entities from text."""
-        return {}
+        if self._entity_regex is None:
+            return {}
+        
+        cached = self._entity_cache.get(text)
+        if cached is None:
+            entities: Dict[str, Dict[str, None]] = {}
+            for match in self._entity_regex.finditer(text):
+                name = match.lastgroup
+                entities.setdefault(name, {})[match.group(name)] = None
+            cached = {name: tuple(found) for name, found in entities.items()}
+            self._entity_cache.put(text, cached)
+        return {name: list(found) for name, found in cached.items()}
+    
+    def analyze_content_density(self, text: str) -> Dict[str, float]:
+        """Measure how dense a text block is.
+        
+        Returns the word and sentence counts, the average sentence length
+        in words and the number of entities per hundred words.
+        """
+        cached = self._density_cache.get(text)
+        if cached is not None:
+            return dict(cached)
+        
+        words = len(_WORD_RE.findall(text))
+        sentences = sum(1 for part in text.translate(_SENT_SPLIT_TABLE).split('.')
+                        if part and not part.isspace())
+        entities = sum(len(found) for found in self.extract_entities(text).values())
+        density = {
+            'word_count': words,
+            'sentence_count': sentences,
+            'avg_sentence_length': words / sentences if sentences else 0.0,
+            'entity_density': entities * 100 / words if words else 0.0,
+        }
+        self._density_cache.put(text, density)
+        return dict(density)
+    
+    def detect_chapter_boundary(self, text_block: str) -> bool:
+        """Check whether a text block marks a chapter boundary.
+        
+        Chapter headings, short numbered section or part headings and
+        common stand-alone headings such as "Introduction" all count.
+        """
+        cached = self._chapter_cache.get(text_block)
+        if cached is None:
+            cached = self._match_chapter_boundary(text_block)
+            self._chapter_cache.put(text_block, cached)
+        return cached
+    
+    def _probe(self, text_block: str) -> int:
+        """Get the mask of detector patterns that could match a text block.
+        
+        The block is lowercased once and searched for the keywords each
+        group of patterns requires; the mask is cached per text, so the
+        detectors called on the same block share one probe.
+        """
+        mask = self._probe_cache.get(text_block)
+        if mask is None:
+            lower = text_block.lower()
+            mask = 0
+            for bit, keywords in _PROBE_KEYWORDS:
+                if any(keyword in lower for keyword in keywords):
+                    mask |= bit
+            self._probe_cache.put(text_block, mask)
+        return mask
+    
+    def _match_chapter_boundary(self, text_block: str) -> bool:
+        """Run the chapter boundary patterns over a text block."""
+        # The keyword probe and first-character checks rule out most blocks
+        # before any pattern runs
+        mask = self._probe(text_block)
+        if mask & _PROBE_CHAPTER and _CHAPTER_RE.search(text_block):
+            return True
+        if text_block[:1].isdigit() or text_block.startswith(('Part', 'PART')):
+            if _NUMBERED_SECTION_RE.search(text_block):
+                return True
+        return bool(mask & _PROBE_HEADING and _COMMON_HEADING_RE.search(text_block))
+    
+    def detect_non_content(self, text_block: str) -> bool:
+        """Check whether a text block is boilerplate rather than content.
+        
+        Copyright notices, ISBNs, bare page numbers and running
+        headers or footers are treated as non-content.
+        """
+        text = text_block.strip()
+        if not text:
+            return True
+        if text.isdecimal():
+            return True
+        mask = self._probe(text_block)
+        if mask & _PROBE_COPYRIGHT and _COPYRIGHT_RE.search(text):
+            return True
+        if mask & _PROBE_ISBN and _ISBN_RE.search(text):
+            return True
+        if mask & _PROBE_PAGE and _HF_PATTERNS[0].match(text):
+            return True
+        if text[0] in '-\u2013\u2014' and _HF_PATTERNS[1].match(text):
+            return True
+        return '|' in text and bool(_HF_PATTERNS[2].match(text))
+    
+    def detect_section_structure(self, text_block: str) -> Dict[str, List[Any]]:
+        """Find the headings and lists within a text block.
+        
+        Lines are classified in one scan over the block. A list is a run
+        of at least two consecutive item lines; any other line ends it.
+        
+        Returns:
+            Dict with 'headings' as a list of heading lines and 'lists'
+            as a list of lists of item texts
+        """
+        structure: Dict[str, List[Any]] = {'headings': [], 'lists': []}
+        items: List[str] = []
+        for match in _STRUCTURE_LINE_RE.finditer(text_block):
+            item = match.group('item')
+            if item is not None:
+                items.append(item.strip())
+                continue
+            if len(items) >= 2:
+                structure['lists'].append(items)
+            items = []
+            heading = match.group('heading')
+            if heading is not None:
+                structure['headings'].append(heading.strip())
+        if len(items) >= 2:
+            structure['lists'].append(items)
+        return structure
+    
+    def detect_narrative_flow(self, chunks: Sequence[str]) -> float:
+        """Score how well consecutive chunk texts flow into each other.
+        
+        Each boundary scores half for the first chunk ending a sentence and
+        half for the overlap of key terms between the end of one chunk and
+        the start of the next. Key terms of each chunk's head and tail are
+        extracted once, as every interior chunk takes part in two
+        boundaries.
+        
+        Returns:
+            Mean boundary score between 0.0 and 1.0; 1.0 for fewer than
+            two chunks
+        """
+        if len(chunks) < 2:
+            return 1.0
+        
+        # Windows are scanned in place by offset rather than sliced out
+        heads = [_extract_key_terms(text, 0, _FLOW_WINDOW) for text in chunks[1:]]
+        total = 0.0
+        for text, head in zip(chunks, heads):
+            tail = _extract_key_terms(text, max(0, len(text) - _FLOW_WINDOW), len(text))
+            last = len(text) - 1
+            while last >= 0 and text[last].isspace():
+                last -= 1
+            ends_sentence = last >= 0 and text[last] in _SENT_END
+            total += 0.5 * ends_sentence + 0.5 * _overlap_score(tail, head)
+        return total / len(heads)
+    
+    def detect_section_type(self, text_block: str, position: float = 0.5) -> 'SectionType':
+        """Classify the section a text block belongs to.
+        
+        Args:
+            text_block: Text to classify
+            position: Relative position in the document, from 0.0 to 1.0
+        """
+        if position < 0.1 and _FRONT_MATTER_RE.search(text_block):
+            return SectionType.FRONT_MATTER
+        if not self._probe(text_block) & (_PROBE_COPYRIGHT | _PROBE_SECTION):
+            if position > 0.9 and _BACK_MATTER_RE.search(text_block):
+                return SectionType.BACK_MATTER
+            return SectionType.MAIN_CONTENT
+        
+        # One scan finds every marker; the highest-priority one present wins
+        best = None
+        for match in _SECTION_TYPE_RE.finditer(text_block):
+            rank = _SECTION_TYPE_RANK[match.lastgroup]
+            if best is None or rank < best:
+                best = rank
+                if rank == 0:
+                    break
+        if best is not None:
+            return _SECTION_TYPE_ORDER[best]
+        if position > 0.9 and _BACK_MATTER_RE.search(text_block):
+            return SectionType.BACK_MATTER
+        return SectionType.MAIN_CONTENT
+
+@lru_cache(maxsize=1)
+def _shared_pattern_detector() -> ContentPatternDetector:
+    """Return the detector shared by chunk managers and strategies.
+    
+    Detectors hold no per-document state, so one instance serves the whole
+    process. Its result caches are shared across documents and threads;
+    each is locked for writes and capped by entry count and text size.
+    """
+    return ContentPatternDetector()
 
 # Exception classes
 class ChunkingError(Exception):
@@ -250,61 +843,106 @@ class ChunkingError(Exception):
 class SemanticChunkStrategy(ChunkingStrategy):
     """Chunks content based on semantic boundaries."""
     
+    def __init__(self, config: Dict[str, Any]) -> None:
+        super().__init__(config)
+        self._max_chunk_size = config.get('max_chunk_size', 2048)
+    
     def split(self, document: DocumentModel) -> List['Chunk']:
-        chunks = []
+        return list(self.split_iter(document))
+    
+    def split_iter(self, document: DocumentModel) -> Generator['Chunk', None, None]:
+        """Yield chunks as they are finalized, splitting oversized ones inline."""
         current_chunk = []
         current_size = 0
         heading_stack = []
-        max_chunk_size = self.config.get('max_chunk_size', 2048)
-        overlap_tokens = self.config.get('overlap_tokens', 200)
+        max_chunk_size = self._max_chunk_size
+        # With a stride configured, chunks become sliding windows that advance
+        # by `stride` tokens, so each one repeats the last
+        # (max_chunk_size - stride) tokens of the previous chunk
+        stride = self.config.get('stride')
         sequence_num = 0
+        # One timestamp per split keeps id generation out of the chunk loop;
+        # microseconds keep ids distinct across back-to-back splits
+        created_at = datetime.now()
+        timestamp = created_at.strftime('%Y%m%d_%H%M%S_%f')
         
         for element in document.content:
             element_dict = ensure_dict(element)  # Convert to dict for consistent access
+            element_type = element_dict.get('type')
+            if type(element_type) is str:
+                # Type names parsed from JSON/YAML are not interned; interning
+                # them lets every later comparison succeed on identity
+                element_type = element_dict['type'] = sys.intern(element_type)
             elem_size = self._get_element_size(element_dict)
             
             # Handle headings specially
-            if element_dict.get('type') == 'heading':
+            if element_type == 'heading':
                 # Handle heading logic...
                 pass
                 
+            # An element larger than a whole chunk is cut by words right here,
+            # so no emitted chunk ever needs a second splitting pass
+            if elem_size > max_chunk_size:
+                if current_chunk:
+                    yield self._build_chunk(current_chunk, current_size, heading_stack,
+                                            sequence_num, timestamp, created_at)
+                    sequence_num += 1
+                for sub_text, sub_size in _split_text_by_words(element_dict.get('text', ''), max_chunk_size):
+                    yield self._build_chunk([_subtext_elem(element_dict, sub_text)], sub_size,
+                                            heading_stack, sequence_num, timestamp, created_at)
+                    sequence_num += 1
+                current_chunk = []
+                current_size = 0
+                continue
+            
             # Check if adding element would exceed max size
             if current_size + elem_size > max_chunk_size and current_chunk:
-                # Create a new chunk...
-                pass
+                yield self._build_chunk(current_chunk, current_size, heading_stack,
+                                        sequence_num, timestamp, created_at)
+                sequence_num += 1
+                
+                if stride is not None:
+                    # Carry the trailing window over into the next chunk,
+                    # leaving room for the element that triggered the break
+                    overlap_size = min(max(0, max_chunk_size - stride), max_chunk_size - elem_size)
+                    current_chunk = self._create_overlap(current_chunk, overlap_size)
+                    current_size = self._get_chunk_size(current_chunk)
+                else:
+                    current_chunk = []
+                    current_size = 0
             
             current_chunk.append(element_dict)
             current_size += elem_size
         
         # Add final chunk if needed
         if current_chunk:
-            metadata = ChunkMetadata(
-                chunk_id=f"chunk_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{sequence_num}",
-                sequence_num=sequence_num,
-                section_title=heading_stack[-1]['text'] if heading_stack else None
-            )
-            metadata.word_count = current_size
-            
-            boundary = ChunkBoundary(
-                start_pos=current_chunk[0].get('position', 0),
-                end_pos=current_chunk[-1].get('position', 0),
-                context=self._extract_context(current_chunk),
-                heading_stack=list(heading_stack),
-                references=self._extract_references(current_chunk)
-            )
-            
-            chunks.append(Chunk(current_chunk, boundary, metadata))
+            yield self._build_chunk(current_chunk, current_size, heading_stack,
+                                    sequence_num, timestamp, created_at)
+    
+    def _build_chunk(self, content: List[Dict[str, Any]], size: int,
+                     heading_stack: List[Dict[str, str]], sequence_num: int,
+                     timestamp: str, created_at: datetime) -> Chunk:
+        """Create a chunk from accumulated content."""
+        assert size <= self._max_chunk_size, \
+            f"Chunk of {size} tokens exceeds max_chunk_size"
+        metadata = ChunkMetadata(
+            chunk_id=f"chunk_{timestamp}_{sequence_num}",
+            sequence_num=sequence_num,
+            section_title=heading_stack[-1]['text'] if heading_stack else None,
+            created_at=created_at
+        )
+        metadata.word_count = size
         
-        # Ensure all chunks respect max size
-        result_chunks = []
-        for chunk in chunks:
-            if chunk.size > max_chunk_size:
-                # Split chunk further
-                pass
-            else:
-                result_chunks.append(chunk)
+        boundary = ChunkBoundary(
+            start_pos=content[0].get('position', 0),
+            end_pos=content[-1].get('position', 0),
+            context=self._extract_context(content),
+            heading_stack=list(heading_stack),
+            _refs_source=content,
+            _extractor=self._extract_references
+        )
         
-        return result_chunks
+        return Chunk(content, boundary, metadata, _size=size, _already_dicts=True)
     
     def _get_element_size(self, element: Union[Dict[str, Any], Any]) -> int:
         """Get size of element in tokens."""
@@ -312,10 +950,8 @@ class SemanticChunkStrategy(ChunkingStrategy):
         element_dict = ensure_dict(element)
         element_type = element_dict.get('type', '')
         
-        if element_type in ['text', 'paragraph']:
-            text = element_dict.get('text', '')
-            size = len(text.split())
-            return size
+        if element_type in _TEXT_TYPES:
+            return _element_word_count(element_dict)
         
         return 0
     
@@ -324,54 +960,43 @@ class SemanticChunkStrategy(ChunkingStrategy):
         return sum(self._get_element_size(elem) for elem in chunk)
     
     def _create_overlap(self, chunk: List[Dict[str, Any]], overlap_tokens: int) -> List[Dict[str, Any]]:
-        """Create overlapping content for next chunk."""
-        overlap = []
-        current_tokens = 0
-        
-        for element in reversed(chunk):
-            elem_size = self._get_element_size(element)
-            if current_tokens + elem_size > overlap_tokens:
-                break
-            overlap.insert(0, element)
-            current_tokens += elem_size
-        
-        return overlap
+        """Create overlapping content for next chunk.
+        
+        The overlap is the longest suffix of the chunk that fits within
+        overlap_tokens. Suffix sizes shrink monotonically with the start
+        index, so the start is found by bisecting the prefix sums instead
+        of walking the chunk backwards.
+        """
+        if not chunk:
+            return []
+        prefix = [0, *accumulate(self._get_element_size(element) for element in chunk)]
+        start = bisect_left(prefix, prefix[-1] - overlap_tokens, 0, len(chunk))
+        return chunk[start:]
     
-    def _extract_context(self, chunk: Sequence[Union[Dict[str, Any], ContentElement]]) -> Dict[str, Any]:
+    def _extract_context(self, chunk: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Extract context from chunk for continuity."""
-        # Ensure we have a list of dictionaries for consistent access
-        chunk_dicts = ensure_dict_list(chunk)
         return {
-            'topics': self._extract_topics(chunk_dicts),
-            'entities': self._extract_entities(chunk_dicts)
+            'topics': self._extract_topics(chunk),
+            'entities': self._extract_entities(chunk)
         }
     
     def _extract_topics(self, chunk: List[Dict[str, Any]]) -> List[str]:
         """Extract main topics from chunk."""
-        from collections import Counter
-        
         # Combine all text content
-        text = ' '.join(
-            element.get('text', '')
-            for element in chunk
-            if element.get('type') in ['text', 'paragraph']
-        )
-        
-        # Remove common stop words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-        words = text.lower().split()
-        words = [w for w in words if w not in stop_words and len(w) > 2]
+        text = _join_text(chunk)
         
-        # Get word frequencies
-        freq = Counter(words).most_common(10)
+        # Count words, skipping short ones and common stop words as they stream by
+        freq = Counter(
+            w for w in text.lower().split() if len(w) > 2 and w not in _STOP_WORDS
+        ).most_common(10)
         
         # Extract key phrases (basic implementation)
-        phrases = re.findall(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', text)
+        phrases = _PHRASE_RE.findall(text)
         phrase_freq = Counter(phrases).most_common(5)
         
         # Combine single words and phrases
         topics = [word for word, _ in freq] + [phrase for phrase, _ in phrase_freq]
-        return list(set(topics))  # Remove duplicates
+        return list(dict.fromkeys(topics))  # Remove duplicates, keeping order
     
     def _extract_entities(self, chunk: List[Dict[str, Any]]) -> List[str]:
         """Extract named entities from chunk."""
@@ -379,17 +1004,17 @@ class SemanticChunkStrategy(ChunkingStrategy):
         # Implementation details...
         return list(entities)
     
-    def _extract_references(self, chunk: Sequence[Union[Dict[str, Any], ContentElement]]) -> Dict[str, List[Dict[str, Any]]]:
+    def _extract_references(self, chunk: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
         """Extract cross-references from chunk."""
-        # Ensure we have a list of dictionaries for consistent access
-        chunk_dicts = ensure_dict_list(chunk)
+        if not self._track_refs:
+            return {}
         references = {
             'internal': [],   # References resolved within this chunk
             'incoming': [],   # References to this chunk's content
             'outgoing': []    # References to other chunks' content
         }
         
-        for element in chunk_dicts:
+        for element in chunk:
             if element.get('type') == 'reference':
                 ref_data = {
                     'id': element.get('id'),
@@ -408,24 +1033,73 @@ class SemanticChunkStrategy(ChunkingStrategy):
             return [chunk]
         
         parts = []
-        # Implementation details...
-        return parts
+        current_part = []
+        current_size = 0
+        
+        for element in chunk.content:
+            elem_size = self._get_element_size(element)
+            
+            if elem_size > max_size:
+                # Flush what we have, then cut the oversized element by words
+                if current_part:
+                    parts.append((current_part, current_size))
+                    current_part, current_size = [], 0
+                for sub_text, sub_size in _split_text_by_words(element.get('text', ''), max_size):
+                    parts.append(([_subtext_elem(element, sub_text)], sub_size))
+                continue
+            
+            if current_size + elem_size > max_size and current_part:
+                parts.append((current_part, current_size))
+                current_part, current_size = [], 0
+            
+            current_part.append(element)
+            current_size += elem_size
+        
+        if current_part:
+            parts.append((current_part, current_size))
+        
+        result = []
+        for part_num, (content, size) in enumerate(parts):
+            metadata = ChunkMetadata(
+                chunk_id=f"{chunk.metadata.chunk_id}_part_{part_num}",
+                sequence_num=chunk.metadata.sequence_num,
+                section_title=chunk.metadata.section_title
+            )
+            metadata.word_count = size
+            
+            boundary = ChunkBoundary(
+                start_pos=content[0].get('position', 0),
+                end_pos=content[-1].get('position', 0),
+                context=chunk.boundary.context,
+                heading_stack=chunk.boundary.heading_stack,
+                _refs_source=content,
+                _extractor=self._extract_references
+            )
+            
+            result.append(Chunk(content, boundary, metadata, _size=size, _already_dicts=True))
+        
+        return result
 
 class TOCBasedChunkStrategy(ChunkingStrategy):
     """Chunks content based on table of contents."""
     
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
-        self.pattern_detector = ContentPatternDetector()
+        self.pattern_detector = _shared_pattern_detector()
+        self._indexed_toc: Any = None
+        self._toc_index: Dict[Tuple[int, str], Dict[str, Any]] = {}
+        self._toc_parent: Dict[int, Dict[str, Any]] = {}
+        self._ref_cache: Dict[Tuple[int, ...], Tuple[List[Any], Dict[str, List[Dict[str, Any]]]]] = {}
     
     def split(self, document: DocumentModel) -> List['Chunk']:
+        self._ref_cache.clear()
         # Implementation details...
         is_test_doc = any(
             elem.get('type') == 'heading' and 'Chapter 1' in elem.get('text', '') 
             for elem in document.content
         )
         if is_test_doc:
-            print("DEBUG: TOC strategy detected test document")
+            logger.debug("TOC strategy detected test document")
             chunks = []
             # More implementation details...
             return chunks
@@ -437,6 +1111,8 @@ class TOCBasedChunkStrategy(ChunkingStrategy):
             # Fallback to semantic chunking if no TOC
             return SemanticChunkStrategy(self.config).split(document)
         
+        self._build_toc_index(toc)
+        
         # Skip TOC section itself
         content_start_idx = 0
         toc_index = -1
@@ -447,79 +1123,84 @@ class TOCBasedChunkStrategy(ChunkingStrategy):
         result_chunks = []
         return result_chunks
     
+    def _build_toc_index(self, toc: Union[Dict[str, Any], Any]) -> None:
+        """Index TOC sections by level and normalized title.
+        
+        The TOC tree is walked once, iteratively and in pre-order, so heading
+        lookups become dict hits. Parents are recorded in a side map rather
+        than written into the TOC sections themselves.
+        """
+        toc_dict = ensure_dict(toc)
+        self._toc_index = {}
+        self._toc_parent = {}
+        
+        stack = [(section, None) for section in reversed(toc_dict.get('sections', []))]
+        while stack:
+            section, parent = stack.pop()
+            key = (section.get('level', 1), sys.intern(_normalize_text(section.get('title', ''))))
+            # Keep the first match in document order
+            self._toc_index.setdefault(key, section)
+            if parent is not None:
+                self._toc_parent[id(section)] = parent
+            stack.extend((subsection, section) for subsection in reversed(section.get('subsections', [])))
+        
+        self._indexed_toc = toc
+    
     def _find_toc_section(self, toc: Union[Dict[str, Any], Any], heading: Union[Dict[str, Any], Any]) -> Optional[Dict[str, Any]]:
         """Find TOC section matching heading."""
-        # Ensure toc and heading are dictionaries for consistent access
-        toc_dict = ensure_dict(toc)
-        heading_dict = ensure_dict(heading)
+        if toc is not self._indexed_toc:
+            self._build_toc_index(toc)
         
-        def _normalize_text(text: str) -> str:
-            """Normalize text for comparison."""
-            return text.lower().strip()
-            
-        def _find_in_sections(sections: List[Dict[str, Any]], 
-                            target_text: str,
-                            target_level: int) -> Optional[Dict[str, Any]]:
-            """Recursively search sections."""
-            for section in sections:
-                # Check if this section matches
-                if (section.get('level', 1) == target_level and
-                    _normalize_text(section.get('title', '')) == target_text):
-                    return section
-                    
-                # Check subsections
-                subsections = section.get('subsections', [])
-                result = _find_in_sections(subsections, target_text, target_level)
-                if result:
-                    result['parent'] = section
-                    return result
-                    
-            return None
-            
-        # Get heading text and level
-        heading_text = _normalize_text(heading_dict.get('text', ''))
-        heading_level = heading_dict.get('level', 1)
-        
-        # Search in TOC sections
-        return _find_in_sections(toc_dict.get('sections', []), heading_text, heading_level)
+        # Ensure heading is a dictionary for consistent access
+        heading_dict = ensure_dict(heading)
+        key = (heading_dict.get('level', 1), _element_norm_text(heading_dict))
+        return self._toc_index.get(key)
     
     def _get_heading_stack(self, section: Optional[Dict[str, Any]]) -> List[Dict[str, str]]:
         """Get heading hierarchy for section."""
         stack = []
         while section:
-            stack.insert(0, {
+            stack.append({
                 'level': section.get('level', 1),
                 'text': section.get('title', ''),
                 'id': section.get('id', '')
             })
-            section = section.get('parent')
+            section = self._toc_parent.get(id(section))
+        stack.reverse()
         return stack
 
     def _extract_references(self, content: Sequence[Union[Dict[str, Any], ContentElement]]) -> Dict[str, List[Dict[str, Any]]]:
         """Extract references from content block."""
+        if not self._track_refs:
+            return {}
+        # Content blocks recur as elements move between chunks during
+        # splitting, so results are cached by element identity. The cached
+        # entry keeps the elements alive so their ids cannot be reused.
+        key = tuple(map(id, content))
+        cached = self._ref_cache.get(key)
+        if cached is not None:
+            return {ref_type: list(refs) for ref_type, refs in cached[1].items()}
+        
         # Ensure content is a list of dictionaries for consistent access
         content_dicts = ensure_dict_list(content)
         
         # Join all text content
-        text = " ".join(
-            elem.get("text", "")
-            for elem in content_dicts
-            if elem.get("type") in ["text", "paragraph"]
-        )
+        text = _join_text(content_dicts)
         
         # Extract entities - ensure we convert the result to the right format
         entities = self.pattern_detector.extract_entities(text)
         
         # Convert lists of strings to lists of dicts
         result = {}
-        for key, value in entities.items():
+        for ref_type, value in entities.items():
             if isinstance(value, list) and value and isinstance(value[0], str):
                 # Convert string values to dicts
-                result[key] = [{'text': v, 'type': key.rstrip('s')} for v in value]
+                result[ref_type] = [{'text': v, 'type': ref_type.rstrip('s')} for v in value]
             else:
-                result[key] = value
-                
-        return result
+                result[ref_type] = value
+        
+        self._ref_cache[key] = (list(content), result)
+        return {ref_type: list(refs) for ref_type, refs in result.items()}
     
     def _split_large_chunk(self, chunk: Chunk, max_size: int) -> List['Chunk']:
         """Split a large chunk into smaller chunks."""
@@ -530,10 +1211,82 @@ class TOCBasedChunkStrategy(ChunkingStrategy):
 class FixedSizeChunkStrategy(ChunkingStrategy):
     """Split content into fixed-size chunks."""
 
+    def __init__(self, config: Dict[str, Any]) -> None:
+        super().__init__(config)
+        self._chunk_size = config.get('chunk_size', 2048)
+
     def split(self, document: DocumentModel) -> List['Chunk']:
         """Split content into fixed-size chunks."""
-        # Implementation details...
-        return []
+        chunks = []
+        current_chunk = deque()
+        current_size = 0
+        heading_stack = []
+        chunk_size = self._chunk_size
+        sequence_num = 0
+        created_at = datetime.now()
+        timestamp = created_at.strftime('%Y%m%d_%H%M%S_%f')
+        
+        for element in self._with_paragraph_ends(document.content):
+            elem_size = self._get_element_size(element)
+            
+            # Emit up to the best break point until the element fits
+            while current_chunk and current_size + elem_size > chunk_size:
+                break_idx, break_size = self._find_break_point(current_chunk, current_size)
+                # Pop the emitted prefix off in place; the remainder stays queued
+                break_content = [current_chunk.popleft() for _ in range(break_idx)]
+                current_size -= break_size
+                break_content = [elem for elem in break_content if elem is not _PARAGRAPH_END]
+                if break_content:
+                    chunks.append(self._create_chunk(break_content, break_size, heading_stack,
+                                                     sequence_num, timestamp, created_at))
+                    sequence_num += 1
+            
+            if element.get('type') == 'heading':
+                level = element.get('level', 1)
+                while heading_stack and heading_stack[-1]['level'] >= level:
+                    heading_stack.pop()
+                heading_stack.append({'level': level, 'text': element.get('text', '')})
+            
+            current_chunk.append(element)
+            current_size += elem_size
+        
+        final_content = [elem for elem in current_chunk if elem is not _PARAGRAPH_END]
+        if final_content:
+            chunks.append(self._create_chunk(final_content, current_size, heading_stack,
+                                             sequence_num, timestamp, created_at))
+        
+        # Elements larger than a whole chunk still need to be cut down
+        result_chunks = []
+        for chunk in chunks:
+            if chunk.size > chunk_size:
+                result_chunks.extend(self._split_large_chunk(chunk, chunk_size))
+            else:
+                result_chunks.append(chunk)
+        
+        return result_chunks
+    
+    def _create_chunk(self, content: List[Dict[str, Any]], size: int,
+                      heading_stack: List[Dict[str, Any]], sequence_num: int,
+                      timestamp: str, created_at: datetime) -> Chunk:
+        """Create a chunk from accumulated content."""
+        metadata = ChunkMetadata(
+            chunk_id=f"chunk_{timestamp}_{sequence_num}",
+            sequence_num=sequence_num,
+            section_title=heading_stack[-1]['text'] if heading_stack else None,
+            created_at=created_at
+        )
+        metadata.word_count = size
+        
+        boundary = ChunkBoundary(
+            start_pos=content[0].get('position', 0),
+            end_pos=content[-1].get('position', 0),
+            context={},
+            heading_stack=list(heading_stack),
+            _refs_source=content,
+            _extractor=self._extract_references
+        )
+        
+        return Chunk(content, boundary, metadata, _size=size, _already_dicts=True)
 
     def _get_element_size(self, element: Union[Dict[str, Any], Any]) -> int:
         """Get size of element in tokens."""
@@ -541,31 +1294,109 @@ class FixedSizeChunkStrategy(ChunkingStrategy):
         element_dict = ensure_dict(element)
         element_type = element_dict.get('type', '')
         
-        if element_type in ['text', 'paragraph']:
-            text = element_dict.get('text', '')
-            size = len(text.split())
-            return size
+        if element_type in _TEXT_TYPES:
+            return _element_word_count(element_dict)
         
         return 0
     
-    def _find_break_point(self, content: List[Dict[str, Any]]) -> int:
-        """Find a natural break point in the content."""
-        # Implementation details...
-        return 0
+    def _with_paragraph_ends(self, content: Sequence[Union[Dict[str, Any], ContentElement]]) -> Generator[Dict[str, Any], None, None]:
+        """Yield content elements, marking paragraph ends as natural break points.
+        
+        Markers are generated on the fly so the document is never copied.
+        They are all the shared _PARAGRAPH_END hint, which split() drops
+        before building chunks.
+        """
+        for element in content:
+            element_dict = ensure_dict(element)
+            yield element_dict
+            if _element_ends_sentence(element_dict):
+                yield _PARAGRAPH_END
+    
+    def _find_break_point(self, content: Sequence[Dict[str, Any]], content_size: int) -> Tuple[int, int]:
+        """Find a natural break point in the content.
+        
+        Returns the number of leading elements to emit as a chunk together
+        with their total size, given the size of the whole content. Structural
+        breaks are preferred over sentence ends, which are preferred over a
+        purely size-based cut. A chunk ends after a paragraph end, but just
+        before a heading or section break so those open the next chunk
+        along with their section. Both natural kinds are found in a single
+        reverse pass that stops at the last structural break, accumulating
+        the size of the elements passed over so the size of the emitted
+        part never has to be summed separately.
+        """
+        sentence_idx = -1
+        sentence_tail_size = 0
+        tail_size = 0
+        # Iterate rather than index so a deque is walked in linear time
+        for i, element in zip(range(len(content) - 1, -1, -1), reversed(content)):
+            element_type = element.get('type')
+            elem_size = self._get_element_size(element)
+            if element_type == 'paragraph_end':
+                return i + 1, content_size - tail_size
+            # Breaking before the first element would emit nothing
+            if element_type in _SPLIT_BEFORE_TYPES and i:
+                return i, content_size - tail_size - elem_size
+            if sentence_idx == -1 and _element_ends_sentence(element):
+                sentence_idx = i
+                sentence_tail_size = tail_size
+            tail_size += elem_size
+        
+        if sentence_idx >= 0:
+            return sentence_idx + 1, content_size - sentence_tail_size
+        
+        # No natural break: take as many elements as fit
+        chunk_size = self._chunk_size
+        total = 0
+        for i, element in enumerate(content):
+            elem_size = self._get_element_size(element)
+            if total + elem_size > chunk_size:
+                return (i, total) if i else (1, elem_size)
+            total += elem_size
+        return len(content), total
 
     def _split_large_chunk(self, chunk: Chunk, max_size: int) -> List['Chunk']:
         """Split a large chunk into smaller chunks that respect max_size."""
-        # Implementation details...
-        return []
+        parts = []
+        current_part = []
+        current_size = 0
+        # A word slice of one element holds no reference elements, so its
+        # shards skip extraction and share one empty result, matching what
+        # _extract_references returns for content without references
+        shard_refs = {'internal': [], 'outgoing': []} if self._track_refs else {}
+        
+        for element in chunk.content:
+            elem_size = self._get_element_size(element)
+            
+            if elem_size > max_size:
+                if current_part:
+                    parts.append(self._create_chunk_from_part(chunk, current_part, current_size, len(parts)))
+                    current_part, current_size = [], 0
+                for sub_text, sub_size in _split_text_by_words(element.get('text', ''), max_size):
+                    parts.append(self._create_chunk_from_part(
+                        chunk, [_subtext_elem(element, sub_text)], sub_size, len(parts),
+                        references=shard_refs))
+                continue
+            
+            if current_size + elem_size > max_size and current_part:
+                parts.append(self._create_chunk_from_part(chunk, current_part, current_size, len(parts)))
+                current_part, current_size = [], 0
+            
+            current_part.append(element)
+            current_size += elem_size
+        
+        if current_part:
+            parts.append(self._create_chunk_from_part(chunk, current_part, current_size, len(parts)))
+        
+        return parts
     
     def _create_chunk_from_part(self, original_chunk: Chunk, content_part: List[Dict[str, Any]], 
-                              size: int) -> Chunk:
+                              size: int, part_num: int = 0,
+                              references: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Chunk:
         """Create a new chunk from part of an original chunk."""
-        # Implementation details...
-        content_part = ensure_dict_list(content_part)  # Ensure content_part is a list of dicts
         # Create new metadata and boundary
         metadata = ChunkMetadata(
-            chunk_id=f"{original_chunk.metadata.chunk_id}_part_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            chunk_id=f"{original_chunk.metadata.chunk_id}_part_{part_num}",
             sequence_num=original_chunk.metadata.sequence_num,
             section_title=original_chunk.metadata.section_title
         )
@@ -578,18 +1409,19 @@ class FixedSizeChunkStrategy(ChunkingStrategy):
         boundary = ChunkBoundary(
             start_pos=start_pos,
             end_pos=end_pos,
-            context=original_chunk.boundary.context.copy() if original_chunk.boundary.context else {},
-            heading_stack=original_chunk.boundary.heading_stack.copy() if original_chunk.boundary.heading_stack else [],
-            references=self._extract_references(content_part)
+            context=original_chunk.boundary.context if original_chunk.boundary.context else {},
+            heading_stack=original_chunk.boundary.heading_stack if original_chunk.boundary.heading_stack else [],
+            references=references,
+            _refs_source=content_part,
+            _extractor=self._extract_references
         )
         
-        return Chunk(content_part, boundary, metadata, _size=size)
+        return Chunk(content_part, boundary, metadata, _size=size, _already_dicts=True)
 
-    def _extract_references(self, content_elements: Sequence[Union[Dict[str, Any], ContentElement]]) -> Dict[str, List[Dict[str, Any]]]:
+    def _extract_references(self, content_elements: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
         """Extract references from content elements."""
-        # Ensure content_elements is a list of dictionaries for consistent access
-        content_dicts = ensure_dict_list(content_elements)
-        
+        if not self._track_refs:
+            return {}
         references = {
             "internal": [],
             "outgoing": []
@@ -597,28 +1429,56 @@ class FixedSizeChunkStrategy(ChunkingStrategy):
         # Implementation details...
         return references
 
+_STRATEGIES = {
+    'semantic': SemanticChunkStrategy,
+    'toc': TOCBasedChunkStrategy,
+    'fixed_size': FixedSizeChunkStrategy
+}
+
+# Strategies whose instances hold nothing but their config. The TOC strategy
+# keeps the last document's TOC index and reference cache, so each manager
+# builds its own.
+_SHAREABLE_STRATEGIES = frozenset(('semantic', 'fixed_size'))
+
+@lru_cache(maxsize=16)
+def _make_strategy(strategy_name: str, config_key: str) -> ChunkingStrategy:
+    """Build a shareable strategy from a serialized config.
+    
+    These strategies keep no document state between splits, so managers
+    created with equal configs share one instance.
+    """
+    return _STRATEGIES[strategy_name](json.loads(config_key))
+
 class ChunkManager:
     """Manages document chunking with multiple strategies and enhanced features."""
     
     def __init__(self, config: Dict[str, Any]) -> None:
         """Initialize chunk manager."""
         self.config = config
-        self.pattern_detector = ContentPatternDetector()
+        self.pattern_detector = _shared_pattern_detector()
         self.strategy = self._get_strategy(config.get('strategy', 'semantic'))
         self.chunks: List[Chunk] = []
+        # Size limits are resolved once and shared by the post-processing passes
+        self._max_sz = config.get('max_chunk_size', 2048)
+        self._min_sz = config.get('min_chunk_size', 0)
+        # Ids for chunks created by merges and splits combine one timestamp
+        # with a counter, so they stay unique without a clock call per chunk
+        self._id_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self._id_counter = count()
         
     def _get_strategy(self, strategy_name: str) -> ChunkingStrategy:
         """Get chunking strategy instance by name."""
-        strategies = {
-            'semantic': SemanticChunkStrategy,
-            'toc': TOCBasedChunkStrategy,
-            'fixed_size': FixedSizeChunkStrategy
-        }
-        
-        if strategy_name not in strategies:
+        if strategy_name not in _STRATEGIES:
             raise ValueError(f"Unknown chunking strategy: {strategy_name}")
-            
-        return strategies[strategy_name](self.config)
+        if strategy_name not in _SHAREABLE_STRATEGIES:
+            return _STRATEGIES[strategy_name](self.config)
+        
+        try:
+            config_key = json.dumps(self.config, sort_keys=True)
+        except TypeError:
+            # Configs holding values JSON cannot represent are not shared
+            return _STRATEGIES[strategy_name](self.config)
+        return _make_strategy(strategy_name, config_key)
     
     def chunk_document(self, document: DocumentModel) -> List['Chunk']:
         """Split document using configured strategy."""
@@ -641,21 +1501,56 @@ class ChunkManager:
             logger.error(f"Error during document chunking: {str(e)}")
             raise ChunkingError(f"Failed to chunk document: {str(e)}")
 
+    def chunk_documents(self, documents: Sequence[DocumentModel],
+                        max_workers: Optional[int] = None) -> List[List['Chunk']]:
+        """Split several documents in parallel worker processes.
+        
+        Each worker builds its own ChunkManager from this manager's config, so
+        no strategy or pattern detector state is shared between processes.
+        Results are returned in input order; self.chunks is left untouched.
+        """
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_chunk_document_worker, repeat(self.config), documents,
+                                     chunksize=4))
+
     def merge_chunks(self, chunk_indices: List[int]) -> Chunk:
-        """Merge specified chunks into a single chunk."""
+        """Merge specified chunks into a single chunk.
+        
+        Chunks are combined in document order whatever order the indices
+        are given in, and the merged chunk takes the place of the first.
+        """
         if not all(0 <= idx < len(self.chunks) for idx in chunk_indices):
             raise ValueError(f"Invalid chunk indices: {chunk_indices}")
         if not chunk_indices:
             raise ValueError("No chunks specified for merging")
         
         # Get chunks to merge
-        chunks_to_merge = [self.chunks[idx] for idx in chunk_indices]
+        merged_indices = sorted(set(chunk_indices))
+        chunks_to_merge = [self.chunks[idx] for idx in merged_indices]
         
         # Calculate total size - this is critical for proper size calculation
         sizes = [chunk.size for chunk in chunks_to_merge]
         total_size = sum(sizes)
-        print(f"DEBUG: Merging chunks with sizes: {sizes}, total: {total_size}")
+        logger.debug("Merging chunks with sizes %s, total %d", sizes, total_size)
         
+        merged_chunk = self._combine_chunks(
+            chunks_to_merge, self._next_chunk_id('merged'), total_size
+        )
+        
+        # Rebuild the chunks list in one pass rather than popping each index
+        skipped = set(merged_indices)
+        remaining = [chunk for idx, chunk in enumerate(self.chunks) if idx not in skipped]
+        remaining.insert(merged_indices[0], merged_chunk)
+        self.chunks[:] = remaining
+        
+        return merged_chunk
+
+    def _next_chunk_id(self, prefix: str) -> str:
+        """Generate a unique id for a chunk created by this manager."""
+        return f"{prefix}_{self._id_timestamp}_{next(self._id_counter)}"
+
+    def _combine_chunks(self, chunks_to_merge: List[Chunk], chunk_id: str, total_size: int) -> Chunk:
+        """Build one chunk from consecutive chunks without touching self.chunks."""
         # Merge content from all chunks
         merged_content = []
         for chunk in chunks_to_merge:
@@ -666,14 +1561,14 @@ class ChunkManager:
         boundary = ChunkBoundary(
             start_pos=first_chunk.boundary.start_pos,
             end_pos=last_chunk.boundary.end_pos,
-            context=first_chunk.boundary.context.copy(),
-            heading_stack=first_chunk.boundary.heading_stack.copy(),
+            context=self._merge_contexts([c.boundary.context for c in chunks_to_merge]),
+            heading_stack=first_chunk.boundary.heading_stack,
             references=self._merge_references([c.boundary.references for c in chunks_to_merge])
         )
         
         # Create metadata
         metadata = ChunkMetadata(
-            chunk_id=f"merged_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            chunk_id=chunk_id,
             sequence_num=first_chunk.metadata.sequence_num,
             section_title=first_chunk.metadata.section_title
         )
@@ -682,40 +1577,192 @@ class ChunkManager:
         metadata.word_count = total_size
         
         # Create the merged chunk with explicit size
-        merged_chunk = Chunk(merged_content, boundary, metadata, _size=total_size)
-        print(f"DEBUG: Merged chunk size verification: {merged_chunk.size}, calculated total: {total_size}")
-        
-        # Update chunks list
-        for idx in sorted(chunk_indices, reverse=True):
-            self.chunks.pop(idx)
-        self.chunks.insert(chunk_indices[0], merged_chunk)
-        
-        return merged_chunk
+        return Chunk(merged_content, boundary, metadata, _size=total_size, _already_dicts=True)
 
     def split_chunk(self, chunk_idx: int, split_points: List[int]) -> List['Chunk']:
-        """Split a chunk at specified points."""
-        # Implementation details...
-        return []
+        """Split a chunk at specified points.
+        
+        Split points are word offsets into the chunk's text. Elements that
+        straddle a split point are cut at the word boundary; elements without
+        text stay with the words that follow them.
+        """
+        if not 0 <= chunk_idx < len(self.chunks):
+            raise ValueError(f"Invalid chunk index: {chunk_idx}")
+        chunk = self.chunks[chunk_idx]
+        content = chunk.content
+        
+        # Element word offsets let the element holding a given word be found
+        # by bisection instead of expanding every word
+        columns = _ContentColumns(content)
+        elem_sizes, elem_offsets, total = columns.sizes, columns.offsets, columns.total
+        
+        points = sorted(set(split_points))
+        if not points or points[0] <= 0 or points[-1] >= total:
+            raise ValueError(f"Invalid split points {split_points} for chunk of {total} words")
+        
+        ref_index = self._index_references(chunk.boundary.references)
+        new_chunks = []
+        bounds = [0, *points, total]
+        for start, stop in zip(bounds, bounds[1:]):
+            idx = bisect_left(elem_offsets, start)
+            if idx > 0 and elem_offsets[idx - 1] + elem_sizes[idx - 1] > start:
+                idx -= 1
+            
+            part = []
+            while idx < len(content) and (elem_offsets[idx] < stop or stop == total):
+                elem, offset, size = content[idx], elem_offsets[idx], elem_sizes[idx]
+                lo, hi = max(start, offset) - offset, min(stop, offset + size) - offset
+                if size == 0 or (lo == 0 and hi == size):
+                    part.append(elem)
+                else:
+                    text = elem.get('text', '')
+                    spans = [match.span() for match in _WORD_RE.finditer(text)]
+                    part.append(_subtext_elem(elem, text[spans[lo][0]:spans[hi - 1][1]]))
+                idx += 1
+            new_chunks.append(self._create_split_part(chunk, part, stop - start, ref_index))
+        
+        self.chunks[chunk_idx:chunk_idx + 1] = new_chunks
+        return new_chunks
+    
+    def _create_split_part(self, chunk: Chunk, content: List[Dict[str, Any]], size: int,
+                           ref_index: Dict[str, Tuple[List[int], List[Dict[str, Any]]]]) -> Chunk:
+        """Create a chunk holding part of a chunk being split."""
+        start_pos = content[0].get('position', 0)
+        end_pos = content[-1].get('position', 0)
+        metadata = ChunkMetadata(
+            chunk_id=self._next_chunk_id('split'),
+            sequence_num=chunk.metadata.sequence_num,
+            section_title=chunk.metadata.section_title
+        )
+        metadata.word_count = size
+        
+        boundary = ChunkBoundary(
+            start_pos=start_pos,
+            end_pos=end_pos,
+            context=chunk.boundary.context,
+            heading_stack=chunk.boundary.heading_stack,
+            references=self._filter_references(chunk.boundary.references, start_pos, end_pos,
+                                               ref_index)
+        )
+        
+        return Chunk(content, boundary, metadata, _size=size, _already_dicts=True)
 
     def save_chunks(self, output_dir: Path) -> List[Path]:
-        """Save chunks to files in the output directory."""
-        # Implementation details...
-        return []
+        """Save chunks to files in the output directory.
+        
+        Each chunk is serialized as a chunk_NNNN entry, as YAML by default
+        or as JSON when serialization_format is 'json'. Entries are written
+        as separate files, or with save_format 'tar' into one uncompressed
+        chunks.tar archive, which turns thousands of small writes into one
+        sequential stream. The entries written are listed in a manifest;
+        entries an earlier save listed there but this one does not write
+        are removed, and no other file in the directory is touched.
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        use_json = self.config.get('serialization_format', 'yaml') == 'json'
+        suffix = 'json' if use_json else 'yaml'
+        previous = _read_chunk_manifest(output_dir) or []
+        
+        if self.config.get('save_format', 'dir') == 'tar':
+            archive = output_dir / _CHUNK_ARCHIVE
+            with tarfile.open(archive, 'w', bufsize=1 << 20) as tar:
+                for idx, chunk in enumerate(self.chunks):
+                    data = _serialize_chunk(chunk, use_json)
+                    info = tarfile.TarInfo(f"chunk_{idx:04d}.{suffix}")
+                    info.size = len(data)
+                    tar.addfile(info, io.BytesIO(data))
+            saved = [archive]
+        else:
+            saved = []
+            for idx, chunk in enumerate(self.chunks):
+                chunk_file = output_dir / f"chunk_{idx:04d}.{suffix}"
+                with open(chunk_file, 'wb', buffering=1 << 16) as f:
+                    f.write(_serialize_chunk(chunk, use_json))
+                saved.append(chunk_file)
+        
+        written = [path.name for path in saved]
+        for name in set(previous).difference(written):
+            (output_dir / name).unlink(missing_ok=True)
+        _write_chunk_manifest(output_dir, written)
+        return saved
         
     def load_chunks(self, input_dir: Path) -> None:
-        """Load chunks from a directory."""
-        # Implementation details...
-        pass
+        """Load chunks from a directory.
+        
+        The entries listed in the manifest written by save_chunks are read;
+        directories saved without one fall back to every chunk_NNNN file.
+        Chunk entries are parsed independently, so large sets are parsed in
+        worker processes; chunks keep their entry name order.
+        """
+        input_dir = Path(input_dir)
+        archive = input_dir / _CHUNK_ARCHIVE
+        listed = _read_chunk_manifest(input_dir)
+        if listed is not None and _CHUNK_ARCHIVE not in listed:
+            files = sorted(input_dir / name for name in listed)
+            names = [path.name for path in files]
+            payloads = [path.read_bytes() for path in files]
+        elif archive.exists():
+            with tarfile.open(archive, 'r') as tar:
+                members = sorted((m for m in tar.getmembers() if m.isfile()), key=lambda m: m.name)
+                names = [member.name for member in members]
+                payloads = [tar.extractfile(member).read() for member in members]
+        else:
+            files = sorted(path for path in input_dir.glob('chunk_*')
+                           if _CHUNK_FILE_RE.fullmatch(path.name))
+            names = [path.name for path in files]
+            payloads = [path.read_bytes() for path in files]
+        
+        if len(names) < _PARALLEL_LOAD_MIN_FILES:
+            self.chunks = [_parse_chunk_data(name, data) for name, data in zip(names, payloads)]
+            return
+        
+        chunksize = max(1, len(names) // (4 * (os.cpu_count() or 1)))
+        with ProcessPoolExecutor() as executor:
+            self.chunks = list(executor.map(_parse_chunk_data, names, payloads, chunksize=chunksize))
 
     def analyze_coherence(self, chunk_indices: Optional[List[int]] = None) -> float:
-        """Analyze narrative coherence between chunks."""
-        # Implementation details...
-        return 1.0
+        """Analyze narrative coherence between chunks.
+        
+        Scores each pair of consecutive chunks among chunk_indices (all
+        chunks by default) and returns the mean. A pair scores its topic
+        overlap, raised towards 1.0 by the share of the first chunk's
+        outgoing references that the second chunk resolves. Topic sets are
+        built once per chunk and shared by both pairs the chunk belongs to.
+        """
+        if chunk_indices is None:
+            indices = list(range(len(self.chunks)))
+        else:
+            if not all(0 <= idx < len(self.chunks) for idx in chunk_indices):
+                raise ValueError(f"Invalid chunk indices: {chunk_indices}")
+            indices = sorted(set(chunk_indices))
+        if len(indices) < 2:
+            return 1.0
+        
+        chunks = [self.chunks[idx] for idx in indices]
+        topic_sets = [frozenset(chunk.boundary.context.get('topics', ())) for chunk in chunks]
+        outgoing = [_sorted_targets(chunk.boundary.references, 'outgoing') for chunk in chunks]
+        resolved = [_sorted_targets(chunk.boundary.references, 'internal') for chunk in chunks]
+        
+        total = 0.0
+        for idx in range(len(chunks) - 1):
+            overlap = self._calculate_topic_overlap(topic_sets[idx], topic_sets[idx + 1])
+            continuity = _target_continuity(outgoing[idx], resolved[idx + 1])
+            total += overlap + (1.0 - overlap) * continuity
+        return total / (len(chunks) - 1)
 
     def _prepare_document(self, document: DocumentModel) -> None:
-        """Prepare document for chunking."""
-        # Implementation details...
-        pass
+        """Prepare document for chunking.
+        
+        Every element is already visited here, so the word count of each
+        text element and whether it ends a sentence are cached on it once.
+        Strategies, balancing and splitting then sum cached counts instead
+        of re-splitting text.
+        """
+        for element in document.content:
+            if isinstance(element, dict) and element.get('type') in _TEXT_TYPES:
+                _element_word_count(element)
+                _element_ends_sentence(element)
 
     def _post_process_chunks(self, chunks: List[Chunk]) -> List[Chunk]:
         """Post-process chunks to ensure quality."""
@@ -725,32 +1772,153 @@ class ChunkManager:
         # Ensure narrative coherence
         chunks = self._ensure_coherence(chunks)
         
+        # Coherence fixes can push chunks past the limits, and references
+        # must be resolved against the final chunks
+        chunks = self._enforce_size_constraints(chunks)
+        
         # Update cross-references
         if self.config.get('track_references', True):
             chunks = self._update_chunk_references(chunks)
-        
-        chunks = self._enforce_size_constraints(chunks)
         return chunks
         
     def _balance_chunks(self, chunks: List[Chunk]) -> List[Chunk]:
-        """Balance chunks to have more even size distribution."""
-        # Implementation details...
+        """Balance chunks to have more even size distribution.
+        
+        Runs of consecutive chunks smaller than min_chunk_size are merged as
+        long as the result stays within max_chunk_size. Runs are collected in
+        one forward pass and applied back to front with slice assignment, so
+        indices of runs not yet applied stay valid. Chunks that overlap their
+        neighbour are never merged, as that would duplicate content.
+        Oversized chunks are left to _enforce_size_constraints.
+        """
+        max_sz, min_sz = self._max_sz, self._min_sz
+        if min_sz <= 0 or len(chunks) < 2:
+            return chunks
+        
+        sizes = [chunk.size for chunk in chunks]
+        runs = []  # (start, stop, total size) of each mergeable run
+        start, run_size = 0, sizes[0]
+        for idx in range(1, len(chunks) + 1):
+            if (idx < len(chunks) and sizes[idx] < min_sz and sizes[idx - 1] < min_sz and
+                    run_size + sizes[idx] <= max_sz and
+                    chunks[idx - 1].boundary.end_pos < chunks[idx].boundary.start_pos):
+                run_size += sizes[idx]
+                continue
+            if idx - start > 1:
+                runs.append((start, idx, run_size))
+            if idx < len(chunks):
+                start, run_size = idx, sizes[idx]
+        
+        for start, stop, run_size in reversed(runs):
+            group = chunks[start:stop]
+            chunks[start:stop] = [self._combine_chunks(group, group[0].metadata.chunk_id, run_size)]
         return chunks
 
     def _ensure_coherence(self, chunks: List[Chunk]) -> List[Chunk]:
-        """Ensure narrative coherence between chunks."""
-        # Implementation details...
+        """Ensure narrative coherence between chunks.
+        
+        A chunk ending in the middle of a sentence hands its trailing
+        unfinished text elements to the next chunk, provided that chunk
+        continues with text and the two do not overlap. Every chunk keeps
+        at least one element. The moves are collected first and each
+        receiving chunk is rebuilt once, rather than inserting at its
+        front element by element.
+        """
+        moves = []  # (receiving chunk index, moved elements in order)
+        for idx in range(len(chunks) - 1):
+            chunk, following = chunks[idx], chunks[idx + 1]
+            if (not following.content or
+                    following.content[0].get('type') not in _TEXT_TYPES or
+                    chunk.boundary.end_pos >= following.boundary.start_pos):
+                continue
+            moved = []
+            while (len(chunk.content) > 1 and
+                   chunk.content[-1].get('type') in _TEXT_TYPES and
+                   not _element_ends_sentence(chunk.content[-1])):
+                moved.append(chunk.pop_element())
+            if moved:
+                moved.reverse()
+                chunk.boundary.end_pos = chunk.content[-1].get('position', chunk.boundary.end_pos)
+                moves.append((idx + 1, moved))
+        
+        for idx, moved in moves:
+            chunks[idx].prepend_elements(moved)
+            chunks[idx].boundary.start_pos = moved[0].get('position', chunks[idx].boundary.start_pos)
         return chunks
 
     def _update_chunk_references(self, chunks: List[Chunk]) -> List[Chunk]:
-        """Update cross-references between chunks."""
-        # Implementation details...
+        """Update cross-references between chunks.
+        
+        Outgoing references are resolved against the ids of the elements
+        each chunk defines. Those resolved within their own chunk move to
+        internal; those resolved elsewhere gain the target chunk's id and
+        are recorded as incoming on it. Each chunk's references are rebuilt
+        as a new dict and assigned back, never updated in place, so empty
+        reference dicts shared by split shards stay empty; incoming
+        references are added to each target chunk in one step.
+        """
+        # First definition wins, so chunks are walked back to front
+        ref_map = {
+            elem['id']: idx
+            for idx in range(len(chunks) - 1, -1, -1)
+            for elem in chunks[idx].content
+            if elem.get('id') is not None and elem.get('type') != 'reference'
+        }
+        
+        incoming_by_chunk: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        for idx, chunk in enumerate(chunks):
+            references = chunk.boundary.references
+            outgoing = references.get('outgoing')
+            if not outgoing:
+                continue
+            chunk_id = chunk.metadata.chunk_id
+            new_internal = list(references.get('internal', ()))
+            new_outgoing = []
+            for ref in outgoing:
+                target_idx = ref_map.get(ref.get('id'), ref_map.get(ref.get('target')))
+                if target_idx == idx:
+                    new_internal.append(ref)
+                    continue
+                if target_idx is not None:
+                    ref = {**ref, 'target_chunk': chunks[target_idx].metadata.chunk_id}
+                    incoming_by_chunk[target_idx].append({**ref, 'source_chunk': chunk_id})
+                new_outgoing.append(ref)
+            chunk.boundary.references = {**references, 'internal': new_internal,
+                                         'outgoing': new_outgoing}
+        
+        for target_idx, incoming in incoming_by_chunk.items():
+            boundary = chunks[target_idx].boundary
+            references = boundary.references
+            boundary.references = {**references,
+                                   'incoming': [*references.get('incoming', ()), *incoming]}
         return chunks
 
     def _find_optimal_split_point(self, chunk: Chunk) -> Optional[int]:
-        """Find optimal point to split a large chunk."""
-        # Implementation details...
-        return None
+        """Find optimal point to split a large chunk.
+        
+        Returns a word offset suitable for split_chunk, or None when the
+        chunk has no element boundary inside its text. Element boundaries
+        are scored by closeness to the middle of the chunk, with a bonus
+        before headings and section breaks and a smaller one after sentence
+        and paragraph ends.
+        """
+        columns = _ContentColumns(chunk.content)
+        total, types, offsets = columns.total, columns.types, columns.offsets
+        candidates = [idx for idx in range(1, len(types)) if 0 < offsets[idx] < total]
+        if not candidates:
+            return None
+        
+        # Scores are scaled by half the chunk size so each one is a bonus
+        # lookup and a subtraction, and max() does the comparisons
+        half = total / 2
+        ends_sentence = columns.ends_sentence
+        bonus = [0.0] * len(types)
+        for idx in candidates:
+            if types[idx] in _SPLIT_BEFORE_TYPES:
+                bonus[idx] = half
+            elif ends_sentence[idx - 1] or types[idx - 1] == 'paragraph_end':
+                bonus[idx] = half / 2
+        return offsets[max(candidates, key=lambda idx: bonus[idx] - abs(offsets[idx] - half))]
 
     def _validate_chunks(self, chunks: List[Chunk]) -> None:
         """Validate chunk integrity."""
@@ -776,40 +1944,35 @@ class ChunkManager:
         """Extract cross-references from element."""
         # Convert element to dictionary for consistent access
         element_dict = ensure_dict(element)
-        refs = []
         text = element_dict.get('text', '')
         
-        # Extract references
-        figure_refs = self._find_figure_references(text)
-        refs.extend({'type': 'figure', 'target': ref} for ref in figure_refs)
-        
-        table_refs = self._find_table_references(text)
-        refs.extend({'type': 'table', 'target': ref} for ref in table_refs)
-        
-        section_refs = self._find_section_references(text)
-        refs.extend({'type': 'section', 'target': ref} for ref in section_refs)
-        
-        return refs
-
-    def _find_figure_references(self, text: str) -> List[str]:
-        """Extract figure references from text."""
-        import re
-        return re.findall(r'(?:Figure|Fig\.?)\s+(\d+(?:\.\d+)*)', text)
-        
-    def _find_table_references(self, text: str) -> List[str]:
-        """Extract table references from text."""
-        import re
-        return re.findall(r'Table\s+(\d+(?:\.\d+)*)', text)
-        
-    def _find_section_references(self, text: str) -> List[str]:
-        """Extract section references from text."""
-        import re
-        return re.findall(r'Section\s+(\d+(?:\.\d+)*)', text)
+        # One scan finds every kind of reference; the label group that
+        # matched gives its type
+        return [
+            {
+                'type': 'figure' if match['fig'] else 'table' if match['tbl'] else 'section',
+                'target': match['num']
+            }
+            for match in _REF_RE.finditer(text)
+        ]
 
     def _merge_contexts(self, contexts: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Merge multiple contexts into one."""
-        # Implementation details...
-        return {}
+        """Merge multiple contexts into one.
+        
+        List values are concatenated with duplicates dropped, keeping first
+        occurrences in order; other values keep the first one seen.
+        """
+        merged: Dict[str, Any] = {}
+        merged_lists: Dict[str, Dict[Any, None]] = {}
+        for context in contexts:
+            for key, value in context.items():
+                if isinstance(value, list):
+                    merged_lists.setdefault(key, {}).update(dict.fromkeys(value))
+                else:
+                    merged.setdefault(key, value)
+        for key, values in merged_lists.items():
+            merged[key] = list(values)
+        return merged
 
     def _merge_references(self, references_list: List[Dict[str, List[Dict[str, Any]]]]) -> Dict[str, List[Dict[str, Any]]]:
         """Merge reference dictionaries."""
@@ -819,55 +1982,83 @@ class ChunkManager:
             'outgoing': []
         }
         
-        seen_refs = set()  # Track unique references
+        # Track unique references per type, keeping each working set small
+        seen_refs: Dict[str, Set[Tuple[Any, Any, Any]]] = {}
         
         for references in references_list:
             for ref_type, refs in references.items():
+                merged_refs = merged.setdefault(ref_type, [])
+                seen = seen_refs.setdefault(ref_type, set())
                 for ref in refs:
                     ref_key = (ref.get('id'), ref.get('target'), ref.get('position'))
-                    if ref_key not in seen_refs:
-                        merged[ref_type].append(ref)
-                        seen_refs.add(ref_key)
+                    if ref_key not in seen:
+                        merged_refs.append(ref)
+                        seen.add(ref_key)
         
         return merged
 
     def _filter_references(self, references: Dict[str, List[Dict[str, Any]]],
-                         start_pos: int, end_pos: int) -> Dict[str, List[Dict[str, Any]]]:
+                         start_pos: int, end_pos: int,
+                         index: Optional[Dict[str, Tuple[List[int], List[Dict[str, Any]]]]] = None
+                         ) -> Dict[str, List[Dict[str, Any]]]:
         """Filter references to those within position range."""
-        # Implementation details...
+        if index is None:
+            index = self._index_references(references)
         filtered = {
             'internal': [],
             'incoming': [],
             'outgoing': []
         }
         
-        for ref_type, refs in references.items():
-            filtered[ref_type] = [
-                ref for ref in refs
-                if start_pos <= ref.get('position', 0) <= end_pos
-            ]
+        for ref_type, (positions, refs) in index.items():
+            filtered[ref_type] = refs[bisect_left(positions, start_pos):bisect_right(positions, end_pos)]
         
         return filtered
 
+    def _index_references(self, references: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Tuple[List[int], List[Dict[str, Any]]]]:
+        """Sort each reference list by position for range filtering.
+        
+        The index pairs every sorted list with its positions, so a range of
+        references is sliced out by bisection. Build it once when filtering
+        the same references for several ranges.
+        """
+        index = {}
+        for ref_type, refs in references.items():
+            refs_sorted = sorted(refs, key=lambda ref: ref.get('position', 0))
+            index[ref_type] = ([ref.get('position', 0) for ref in refs_sorted], refs_sorted)
+        return index
+
     def _extract_content(self, content: List[Dict[str, Any]],
-                        start_pos: int, end_pos: int) -> List[Dict[str, Any]]:
-        """Extract content elements within position range."""
-        return [
-            elem for elem in content
-            if start_pos <= elem.get('position', 0) <= end_pos
-        ]
+                        start_pos: int, end_pos: int,
+                        positions: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+        """Extract content elements within position range.
+        
+        Content is ordered by position, so the range is sliced out by
+        bisection. Callers extracting several ranges from the same content
+        can pass its precomputed positions.
+        """
+        if positions is None:
+            positions = [elem.get('position', 0) for elem in content]
+        return content[bisect_left(positions, start_pos):bisect_right(positions, end_pos)]
 
-    def _calculate_topic_overlap(self, topics1: List[str], topics2: List[str]) -> float:
-        """Calculate topic overlap between chunks."""
-        # Implementation details...
-        return 0.0
+    def _calculate_topic_overlap(self, topics1: Union[List[str], frozenset],
+                                 topics2: Union[List[str], frozenset]) -> float:
+        """Calculate topic overlap between chunks as Jaccard similarity."""
+        topics1 = topics1 if isinstance(topics1, frozenset) else frozenset(topics1)
+        topics2 = topics2 if isinstance(topics2, frozenset) else frozenset(topics2)
+        union = len(topics1 | topics2)
+        return len(topics1 & topics2) / union if union else 0.0
 
     def _calculate_reference_continuity(self,
                                      refs1: Dict[str, List[Dict[str, Any]]],
                                      refs2: Dict[str, List[Dict[str, Any]]]) -> float:
-        """Calculate reference continuity between chunks."""
-        # Implementation details...
-        return 0.0
+        """Calculate reference continuity between chunks.
+        
+        This is the share of the first chunk's outgoing reference targets
+        that the second chunk resolves internally, by id or target.
+        """
+        return _target_continuity(_sorted_targets(refs1, 'outgoing'),
+                                  _sorted_targets(refs2, 'internal'))
 
     def _analyze_semantic_flow(self,
                              end_elements: List[Dict[str, Any]],
@@ -877,9 +2068,70 @@ class ChunkManager:
         return 0.0
 
     def _enforce_size_constraints(self, chunks: List[Chunk]) -> List[Chunk]:
-        """Ensure all chunks conform to configured size constraints."""
-        # Implementation details...
-        return chunks
+        """Ensure all chunks conform to configured size constraints.
+        
+        Oversized chunks are split by the strategy. Chunks were balanced
+        before this pass, so _balance_chunks only runs again when splitting
+        created new chunks that may be undersized. When no chunk is too
+        large, the chunks are returned untouched.
+        """
+        max_sz = self._max_sz
+        sizes = [chunk.size for chunk in chunks]
+        if not any(size > max_sz for size in sizes):
+            return chunks
+        
+        split = []
+        for chunk, size in zip(chunks, sizes):
+            if size > max_sz:
+                split.extend(self.strategy._split_large_chunk(chunk, max_sz))
+            else:
+                split.append(chunk)
+        
+        if len(split) > len(chunks):
+            split = self._balance_chunks(split)
+        return split
+
+# Below this many files, process start-up costs more than parallel parsing saves
+_PARALLEL_LOAD_MIN_FILES = 64
+
+# Archive written by save_chunks when save_format is 'tar'
+_CHUNK_ARCHIVE = 'chunks.tar'
+
+# Lists the entries the last save_chunks wrote, so the next save replaces
+# only its own output
+_CHUNK_MANIFEST = 'chunks.manifest'
+
+# Names save_chunks gives individual chunk files
+_CHUNK_FILE_RE = re.compile(r'chunk_\d{4,}\.(?:yaml|json)')
+
+def _read_chunk_manifest(directory: Path) -> Optional[List[str]]:
+    """Read the entry names an earlier save listed, or None without a manifest."""
+    manifest = directory / _CHUNK_MANIFEST
+    if not manifest.exists():
+        return None
+    return manifest.read_text(encoding='utf-8').split()
+
+def _write_chunk_manifest(directory: Path, names: List[str]) -> None:
+    """List the entries a save wrote, one name per line."""
+    manifest = directory / _CHUNK_MANIFEST
+    manifest.write_text(''.join(f"{name}\n" for name in names), encoding='utf-8')
+
+def _serialize_chunk(chunk: Chunk, use_json: bool) -> bytes:
+    """Serialize one chunk as JSON or YAML bytes."""
+    if use_json:
+        return json.dumps(chunk.to_dict()).encode('utf-8')
+    return yaml.dump(chunk.to_dict(), Dumper=_YamlDumper,
+                     default_flow_style=False, encoding='utf-8')
+
+def _parse_chunk_data(name: str, data: bytes) -> Chunk:
+    """Parse one saved chunk entry, choosing the format by its name."""
+    if name.endswith('.json'):
+        return Chunk.from_dict(json.loads(data))
+    return Chunk.from_dict(yaml.load(data, Loader=_YamlLoader))
+
+def _chunk_document_worker(config: Dict[str, Any], document: DocumentModel) -> List[Chunk]:
+    """Chunk one document in a worker process."""
+    return ChunkManager(config).chunk_document(document)
 
 class SectionType(Enum):
     """Section type classification."""
@@ -892,6 +2144,112 @@ class SectionType(Enum):
     FOOTNOTES = auto()
     ACKNOWLEDGMENTS = auto()
 
+# Bits of the ContentPatternDetector probe mask, each set when a block
+# contains one of the lowercase keywords its patterns need to match
+_PROBE_CHAPTER = 1
+_PROBE_HEADING = 2
+_PROBE_COPYRIGHT = 4
+_PROBE_ISBN = 8
+_PROBE_PAGE = 16
+_PROBE_SECTION = 32
+_PROBE_KEYWORDS = (
+    (_PROBE_CHAPTER, ('chapter',)),
+    (_PROBE_HEADING, ('prologue', 'epilogue', 'introduction', 'preface',
+                      'foreword', 'afterword', 'conclusion')),
+    (_PROBE_COPYRIGHT, ('copyright', '©', 'reserved')),
+    (_PROBE_ISBN, ('isbn',)),
+    (_PROBE_PAGE, ('page',)),
+    (_PROBE_SECTION, ('index', 'appendix', 'footnote', 'acknowledg')),
+)
+
+# Patterns used by ContentPatternDetector, compiled once at import
+_CHAPTER_RE = re.compile(
+    r'^(?:Chapter|CHAPTER)\s+(?:[0-9]+|[IVXLCDM]+)(?:\s*[-:]\s*.+)?$', re.MULTILINE)
+_NUMBERED_SECTION_RE = re.compile(
+    r'^(?:\d+\.?\s+[A-Z][^\n]{0,80}|(?:Part|PART)\s+(?:[0-9]+|[IVXLCDM]+)\b[^\n]{0,80})$')
+_COMMON_HEADING_RE = re.compile(
+    r'^(?:Prologue|Epilogue|Introduction|Preface|Foreword|Afterword|Conclusion)\s*$',
+    re.IGNORECASE | re.MULTILINE)
+_FRONT_MATTER_RE = re.compile(
+    r'^\s*(?:table\s+of\s+contents|contents|preface|foreword|dedication)\s*$',
+    re.IGNORECASE | re.MULTILINE)
+_BACK_MATTER_RE = re.compile(
+    r'^\s*(?:bibliography|references|works\s+cited|glossary|afterword)\s*$',
+    re.IGNORECASE | re.MULTILINE)
+_COPYRIGHT_RE = re.compile(r'copyright|©|all\s+rights\s+reserved', re.IGNORECASE)
+_ISBN_RE = re.compile(r'\bISBN(?:-1[03])?:?\s*[0-9X-]{10,17}', re.IGNORECASE)
+# Section markers as named groups, in classification priority order. Trailing
+# context is matched by lookahead so no marker consumes text another needs.
+_SECTION_TYPE_RE = re.compile(
+    r'(?P<copyright>copyright|©|all\s+rights\s+reserved)'
+    r'|(?P<index>(?<![^\n])index(?=\s|$))'
+    r'|(?P<appendix>(?<![^\n])appendix(?=\s+[a-z]))'
+    r'|(?P<footnotes>(?<![^\n])footnotes?(?=\s|$))'
+    r'|(?P<ack>(?<![^\n])acknowledge?ments?(?=\s|$))',
+    re.IGNORECASE)
+_SECTION_TYPE_ORDER = (
+    SectionType.COPYRIGHT, SectionType.INDEX, SectionType.APPENDIX,
+    SectionType.FOOTNOTES, SectionType.ACKNOWLEDGMENTS,
+)
+_SECTION_TYPE_RANK = {
+    name: rank for rank, name in enumerate(('copyright', 'index', 'appendix', 'footnotes', 'ack'))
+}
+# One line per match: a list item, a chapter or dotted section heading, or
+# any other line, which ends a run of list items
+_STRUCTURE_LINE_RE = re.compile(
+    r'^[ \t]*(?:\d+\.|[-*])[ \t]+(?P<item>[^\n]+)$'
+    r'|^(?P<heading>(?:Chapter|CHAPTER)[ \t]+(?:[0-9]+|[IVXLCDM]+)\b[^\n]*'
+    r'|\d+(?:\.\d+)+[ \t]+[A-Z][^\n]*)$'
+    r'|^[^\n]*$',
+    re.MULTILINE)
+# Running headers and footers: "Page 3 of 10", "- 3 -", "3 | Title" or "Title | 3"
+_HF_PATTERNS = (
+    re.compile(r'^page\s+\d+(?:\s+of\s+\d+)?$', re.IGNORECASE),
+    re.compile(r'^[-\u2013\u2014]\s*\d+\s*[-\u2013\u2014]$'),
+    re.compile(r'^(?:\d+\s*\|\s*[^\n]{1,80}|[^\n]{1,80}\|\s*\d+)$'),
+)
+
+# Default PatternRegistry patterns as (source, weight), compiled with
+# re.MULTILINE so ^ and $ anchor at line boundaries
+_DEFAULT_PATTERNS = {
+    'chapter_header': (
+        r'^(?:Chapter|CHAPTER)\s+(?:[0-9]+|[IVXLCDM]+)(?:\s*[-:]\s*.+)?$',
+        2.0
+    ),
+    'section_header': (
+        r'^\d+(?:\.\d+)*\s+[A-Z][^\n]+$',
+        1.5
+    ),
+    'paragraph_break': (
+        r'\n\s*\n',
+        0.5
+    ),
+    'footnote': (
+        r'^\[\d+\]|\{\d+\}|\*{1,3}|(?:\d+\s)?^[a-zA-Z]+\d+',
+        1.0
+    ),
+    'page_number': (
+        r'^\s*\d+\s*$',
+        0.3
+    ),
+    'table_of_contents': (
+        r'^(?:Table of Contents|CONTENTS)$',
+        2.0
+    ),
+    'bibliography': (
+        r'^(?:Bibliography|References|Works Cited)$',
+        2.0
+    ),
+    'appendix': (
+        r'^(?:Appendix|APPENDIX)\s+[A-Z]$',
+        2.0
+    )
+}
+_DEFAULT_COMPILED = {
+    name: (re.compile(pattern, re.MULTILINE), weight)
+    for name, (pattern, weight) in _DEFAULT_PATTERNS.items()
+}
+
 class PatternRegistry:
     """Registry for content pattern detection."""
     
@@ -923,44 +2281,12 @@ class PatternRegistry:
         return scores
         
     def _initialize_default_patterns(self):
-        """Initialize default content patterns."""
-        default_patterns = {
-            'chapter_header': (
-                r'^(?:Chapter|CHAPTER)\s+(?:[0-9]+|[IVXLCDM]+)(?:\s*[-:]\s*.+)?$',
-                2.0
-            ),
-            'section_header': (
-                r'^\d+(?:\.\d+)*\s+[A-Z][^\n]+$',
-                1.5
-            ),
-            'paragraph_break': (
-                r'\n\s*\n',
-                0.5
-            ),
-            'footnote': (
-                r'^\[\d+\]|\{\d+\}|\*{1,3}|(?:\d+\s)?^[a-zA-Z]+\d+',
-                1.0
-            ),
-            'page_number': (
-                r'^\s*\d+\\s*$',
-                0.3
-            ),
-            'table_of_contents': (
-                r'(?:^|\n)(?:Table of Contents|CONTENTS)(?:\n|$)',
-                2.0
-            ),
-            'bibliography': (
-                r'(?:^|\n)(?:Bibliography|References|Works Cited)(?:\n|$)',
-                2.0
-            ),
-            'appendix': (
-                r'(?:^|\n)(?:Appendix\s+[A-Z]|APPENDIX\s+[A-Z])(?:\n|$)',
-                2.0
-            )
-        }
+        """Initialize default content patterns.
         
-        for name, (pattern, weight) in default_patterns.items():
-            self.register_pattern(name, pattern, weight)
+        The defaults are compiled once at import and shared; registering a
+        pattern only replaces this registry's own entry.
+        """
+        self._patterns = dict(_DEFAULT_COMPILED)
 
 def create_default_registry() -> PatternRegistry:
     """Create and return a PatternRegistry with default patterns."""
@@ -6,8 +6,14 @@ normalized content into different output formats.
 """
 from abc import ABC, abstractmethod
 from pathlib import Path
+import re
 from typing import Any, Dict, Optional
 
+# Characters dropped from generated filenames, and the separator runs
+# collapsed into single dashes
+_INVALID_CHARS_RE = re.compile(r'[^\w\s-]')
+_DASH_WS_RE = re.compile(r'[-\s]+')
+
 
 class OutputHandler(ABC):
     """Base interface for output handlers.
@@ -103,9 +109,8 @@ class OutputHandler(ABC):
             base_name = "document"
             
         # Clean up the filename to remove invalid characters
-        import re
-        base_name = re.sub(r'[^\w\s-]', '', base_name).strip()
-        base_name = re.sub(r'[-\s]+', '-', base_name)
+        base_name = _INVALID_CHARS_RE.sub('', base_name).strip()
+        base_name = _DASH_WS_RE.sub('-', base_name)
         
         # Append format-specific extension
         extension = self._get_format_extension()
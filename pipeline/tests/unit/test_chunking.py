@@ -33,6 +33,29 @@ class TestChunkBoundary:
         assert len(boundary.heading_stack) == 1
         assert "internal" in boundary.references
 
+    def test_lazy_references(self):
+        """Test that references are extracted only when first read."""
+        calls = []
+
+        def extractor(content):
+            calls.append(content)
+            return {"outgoing": [{"id": "fig1"}]}
+
+        content = [{"type": "reference", "id": "fig1", "position": 0}]
+        boundary = ChunkBoundary(
+            start_pos=0,
+            end_pos=0,
+            context={},
+            heading_stack=[],
+            _refs_source=content,
+            _extractor=extractor
+        )
+
+        assert calls == []
+        assert boundary.references["outgoing"][0]["id"] == "fig1"
+        assert boundary.references["outgoing"][0]["id"] == "fig1"
+        assert calls == [content]
+
 class TestChunkMetadata:
     def test_metadata_initialization(self):
         """Test chunk metadata initialization and properties."""
@@ -75,7 +98,40 @@ class TestChunk:
         """Test chunk size calculation based on content."""
         chunk = create_test_chunk()
         assert chunk.size == 2  # "Test content" has 2 words
-        
+
+    def test_chunk_size_invalidation(self):
+        """Test that content mutators invalidate the cached size."""
+        chunk = create_test_chunk().with_size(2)
+        chunk.prepend_elements([{"type": "text", "text": "three more words", "position": 0}])
+        assert chunk.size == 7
+        chunk.pop_element(0)
+        assert chunk.size == 4
+
+    def test_moved_element_keeps_references(self):
+        """Test that moving an element before references are read keeps them."""
+        content = [
+            {"type": "text", "text": "See figure", "position": 0},
+            {"type": "reference", "id": "fig1", "position": 1}
+        ]
+        strategy = SemanticChunkStrategy({"track_references": True})
+        chunk = Chunk(
+            content=content,
+            boundary=ChunkBoundary(
+                start_pos=0,
+                end_pos=1,
+                context={},
+                heading_stack=[],
+                _refs_source=content,
+                _extractor=strategy._extract_references
+            ),
+            metadata=ChunkMetadata(chunk_id="test_chunk_001", sequence_num=0),
+            _already_dicts=True
+        )
+        following = create_test_chunk(chunk_id="test_chunk_002")
+        following.boundary.references
+        following.prepend_elements([chunk.pop_element()])
+        assert chunk.boundary.references["outgoing"][0]["id"] == "fig1"
+
     def test_chunk_serialization(self):
         """Test chunk serialization to/from dict."""
         chunk = create_test_chunk()
@@ -118,6 +174,54 @@ class TestSemanticChunkStrategy:
         
         assert len(chunks) > 1
         assert all(chunk.size <= 10 for chunk in chunks)
+        
+    def test_split_iter_matches_split(self):
+        """Test that lazily yielded chunks match the eager split."""
+        config = {"max_chunk_size": 50}
+        strategy = SemanticChunkStrategy(config)
+        doc = create_large_test_document(9)
+        
+        eager = strategy.split(doc)
+        lazy = list(strategy.split_iter(doc))
+        
+        assert [c.size for c in lazy] == [c.size for c in eager]
+        assert all(chunk.size <= 50 for chunk in lazy)
+
+    def test_split_large_chunk_shares_boundary(self):
+        """Test that split parts share the parent's context and heading stack."""
+        strategy = SemanticChunkStrategy({"max_chunk_size": 1000})
+        chunk = strategy.split(create_large_test_document(3))[0]
+        parts = strategy._split_large_chunk(chunk, 10)
+
+        assert len(parts) > 1
+        assert all(part.boundary.context is chunk.boundary.context for part in parts)
+        assert all(part.boundary.heading_stack is chunk.boundary.heading_stack for part in parts)
+
+    def test_split_element_keeps_keys(self):
+        """Test that parts of a split element keep its id and other keys."""
+        doc = create_test_document([
+            {"type": "reference", "id": "ref1", "target": "para1", "position": 0},
+            {"type": "text", "text": "word " * 30, "id": "para1", "page": 3, "position": 1},
+        ])
+        chunks = ChunkManager({"max_chunk_size": 10}).chunk_document(doc)
+
+        parts = [elem for chunk in chunks for elem in chunk.content if elem.get("type") == "text"]
+        assert len(parts) > 1
+        assert all(part["id"] == "para1" and part["page"] == 3 for part in parts)
+        outgoing = [ref for chunk in chunks for ref in chunk.boundary.references.get("outgoing", [])]
+        assert outgoing and all("target_chunk" in ref for ref in outgoing)
+
+    def test_reference_tracking_disabled(self):
+        """Test that references are skipped when tracking is off."""
+        doc = create_test_document()
+
+        tracked = SemanticChunkStrategy({"max_chunk_size": 1000}).split(doc)
+        untracked = SemanticChunkStrategy(
+            {"max_chunk_size": 1000, "track_references": False}
+        ).split(doc)
+
+        assert any(c.boundary.references.get('outgoing') for c in tracked)
+        assert all(c.boundary.references == {} for c in untracked)
 
 class TestTOCBasedChunkStrategy:
     def test_toc_based_chunking(self):
@@ -143,6 +247,22 @@ class TestTOCBasedChunkStrategy:
                 # Each chunk should have proper heading hierarchy
                 levels = [h["level"] for h in chunk.boundary.heading_stack]
                 assert sorted(levels) == levels  # Levels should be in ascending order
+                
+    def test_toc_section_lookup(self):
+        """Test nested TOC lookup and heading hierarchy without mutating the TOC."""
+        strategy = TOCBasedChunkStrategy({})
+        toc = {
+            "sections": [{
+                "title": "Chapter 1", "level": 1, "id": "ch1",
+                "subsections": [{"title": "Section 1.1", "level": 2, "id": "sec1.1"}]
+            }]
+        }
+        
+        section = strategy._find_toc_section(toc, {"text": " section 1.1 ", "level": 2})
+        assert section["id"] == "sec1.1"
+        assert "parent" not in section
+        assert [h["id"] for h in strategy._get_heading_stack(section)] == ["ch1", "sec1.1"]
+        assert strategy._find_toc_section(toc, {"text": "Section 1.1", "level": 1}) is None
 
 class TestFixedSizeChunkStrategy:
     def test_fixed_size_chunking(self):
@@ -162,11 +282,35 @@ class TestFixedSizeChunkStrategy:
         doc = create_large_test_document(5)
         chunks = strategy.split(doc)
         
-        # Check if splits occur at paragraph or section boundaries where possible
-        for chunk in chunks[:-1]:  # Skip last chunk
-            if chunk.content:  # Check if content list is not empty
-                last_elem = chunk.content[-1]
-                assert last_elem.get("type") in ["paragraph_end", "section_break", "heading"]
+        # Paragraph-end markers only guide the splits and never reach chunks
+        assert all(elem.get("type") != "paragraph_end" for chunk in chunks for elem in chunk.content)
+        
+        # Check if splits occur at paragraph ends, or just before a heading
+        # or section break so it opens the next chunk
+        for chunk, next_chunk in zip(chunks, chunks[1:]):
+            last_elem = chunk.content[-1]
+            assert last_elem.get("type") not in ["section_break", "heading"]
+            assert (last_elem.get("text", "").rstrip().endswith(".")
+                    or next_chunk.content[0].get("type") in ["section_break", "heading"])
+
+        doc = create_test_document([
+            {"type": "text", "text": "one two three four five six", "position": 0},
+            {"type": "heading", "text": "H2", "level": 2, "position": 1},
+            {"type": "text", "text": "seven eight nine ten eleven twelve", "position": 2},
+        ])
+        chunks = FixedSizeChunkStrategy({"chunk_size": 10}).split(doc)
+        assert [[elem["position"] for elem in chunk.content] for chunk in chunks] == [[0], [1, 2]]
+
+    def test_split_shard_references(self):
+        """Test that word shards of one element share references like regular chunks."""
+        chunk = create_test_chunk(texts=["word " * 30])
+
+        untracked = FixedSizeChunkStrategy({"track_references": False})._split_large_chunk(chunk, 10)
+        assert all(part.boundary.references == {} for part in untracked)
+
+        shards = FixedSizeChunkStrategy({})._split_large_chunk(chunk, 10)
+        assert len(shards) == 3
+        assert all(part.boundary.references is shards[0].boundary.references for part in shards)
 
 class TestChunkManager:
     @pytest.fixture
@@ -188,6 +332,79 @@ class TestChunkManager:
         assert len(chunks) > 0
         assert all(isinstance(c, Chunk) for c in chunks)
         
+    def test_chunk_documents(self, chunk_manager):
+        """Test parallel chunking of several documents."""
+        docs = [create_test_document(), create_large_test_document(6)]
+        results = chunk_manager.chunk_documents(docs, max_workers=2)
+        
+        assert len(results) == 2
+        for doc, chunks in zip(docs, results):
+            expected = ChunkManager(chunk_manager.config).chunk_document(doc)
+            assert [c.size for c in chunks] == [c.size for c in expected]
+
+    def test_strategy_shared_across_managers(self, chunk_manager):
+        """Test that managers with equal configs reuse one strategy."""
+        other = ChunkManager(dict(chunk_manager.config))
+        resized = ChunkManager({**chunk_manager.config, "max_chunk_size": 123})
+
+        assert other.strategy is chunk_manager.strategy
+        assert resized.strategy is not chunk_manager.strategy
+        assert resized.pattern_detector is chunk_manager.pattern_detector
+
+        toc_config = {**chunk_manager.config, "strategy": "toc"}
+        assert ChunkManager(toc_config).strategy is not ChunkManager(dict(toc_config)).strategy
+
+    def test_balance_chunks(self):
+        """Test that runs of small chunks are merged within max size."""
+        manager = ChunkManager({"max_chunk_size": 100, "min_chunk_size": 30})
+
+        sizes = [10, 10, 80, 20, 20, 20, 50, 60, 10]
+        chunks = [
+            create_test_chunk(chunk_id=f"c{pos}", texts=["word " * size], start_pos=pos, size=size)
+            for pos, size in enumerate(sizes)
+        ]
+        balanced = manager._balance_chunks(chunks)
+
+        assert [c.size for c in balanced] == [20, 80, 60, 50, 60, 10]
+        assert [c.metadata.chunk_id for c in balanced] == ["c0", "c2", "c3", "c6", "c7", "c8"]
+        assert balanced[2].boundary.end_pos == 5
+
+    def test_enforce_size_constraints(self):
+        """Test that oversized chunks are split and conforming ones kept."""
+        manager = ChunkManager({"max_chunk_size": 10})
+
+        def make_chunk(pos, sizes):
+            return create_test_chunk(chunk_id=f"c{pos}", texts=["word " * size for size in sizes],
+                                     start_pos=pos, size=sum(sizes))
+
+        fitting = [make_chunk(0, [4, 4]), make_chunk(10, [10])]
+        assert manager._enforce_size_constraints(fitting) is fitting
+
+        chunks = manager._enforce_size_constraints([make_chunk(0, [6, 6]), make_chunk(10, [3])])
+        assert [c.size for c in chunks] == [6, 6, 3]
+        assert [c.metadata.chunk_id for c in chunks] == ["c0_part_0", "c0_part_1", "c10"]
+
+        # Balancing already ran, so an unmergeable small chunk alone is left as is
+        manager = ChunkManager({"max_chunk_size": 10, "min_chunk_size": 5})
+        undersized = [make_chunk(0, [8]), make_chunk(10, [2])]
+        assert manager._enforce_size_constraints(undersized) is undersized
+
+    def test_ensure_coherence(self, chunk_manager):
+        """Test that unfinished sentences move to the following chunk."""
+        texts = [["Done.", "half a", "sentence"], ["continues here.", "and"], ["ends."]]
+        chunks = [
+            create_test_chunk(chunk_id=f"c{idx}", texts=chunk_texts, start_pos=idx * 10)
+            for idx, chunk_texts in enumerate(texts)
+        ]
+        chunks = chunk_manager._ensure_coherence(chunks)
+
+        assert [e["text"] for e in chunks[0].content] == ["Done."]
+        assert [e["text"] for e in chunks[1].content] == ["half a", "sentence", "continues here."]
+        assert [e["text"] for e in chunks[2].content] == ["and", "ends."]
+        assert chunks[0].boundary.end_pos == 0
+        assert chunks[1].boundary.start_pos == 1
+        assert chunks[1].size == 5
+
     def test_merge_chunks(self, chunk_manager):
         """Test chunk merging."""
         doc = create_large_test_document(10)
@@ -205,7 +422,59 @@ class TestChunkManager:
             # Verify correct size and count
             assert merged.size == original_size_0 + original_size_1
             assert len(chunk_manager.chunks) == original_count - 1
-            
+
+    def test_merge_contexts_and_references(self, chunk_manager):
+        """Test order-preserving context merges and per-type reference dedup."""
+        merged = chunk_manager._merge_contexts([
+            {"topics": ["a", "b"], "section": "One"},
+            {"topics": ["b", "c"], "section": "Two", "entities": ["x"]},
+        ])
+        assert merged == {"topics": ["a", "b", "c"], "section": "One", "entities": ["x"]}
+
+        ref = {"id": "fig1", "target": "Figure 1", "position": 3}
+        refs = chunk_manager._merge_references([
+            {"internal": [ref], "outgoing": [ref]},
+            {"outgoing": [dict(ref)]},
+        ])
+        assert refs["internal"] == [ref]
+        assert refs["outgoing"] == [ref]
+
+    def test_update_chunk_references(self, chunk_manager):
+        """Test that outgoing references are resolved to internal or incoming."""
+        def make_chunk(chunk_id, content, outgoing):
+            return create_test_chunk(chunk_id=chunk_id, content=content,
+                                     references={"internal": [], "outgoing": outgoing})
+
+        fig_ref = {"id": "fig1", "target": "Figure 1"}
+        tbl_ref = {"id": "tbl1", "target": "Table 1"}
+        first = make_chunk("c0", [{"type": "figure", "id": "fig1"}], [fig_ref, tbl_ref])
+        second = make_chunk("c1", [{"type": "table", "id": "tbl1"}], [])
+
+        chunk_manager._update_chunk_references([first, second])
+
+        assert first.boundary.references["internal"] == [fig_ref]
+        assert first.boundary.references["outgoing"][0]["target_chunk"] == "c1"
+        assert second.boundary.references["incoming"][0]["source_chunk"] == "c0"
+
+    def test_merged_chunk_ids_unique(self, chunk_manager):
+        """Test that merges in quick succession get distinct ids."""
+        chunk_manager.chunks = [create_test_chunk(f"c{i}") for i in range(4)]
+
+        first = chunk_manager.merge_chunks([0, 1])
+        second = chunk_manager.merge_chunks([1, 2])
+
+        assert first.metadata.chunk_id != second.metadata.chunk_id
+
+    def test_merge_chunks_unsorted_indices(self, chunk_manager):
+        """Test that merges combine chunks in document order at the first index."""
+        chunks = [create_test_chunk(f"c{i}") for i in range(6)]
+        chunk_manager.chunks = list(chunks)
+
+        merged = chunk_manager.merge_chunks([2, 1])
+
+        assert chunk_manager.chunks == [chunks[0], merged, *chunks[3:]]
+        assert merged.content == chunks[1].content + chunks[2].content
+
     def test_split_chunk(self, chunk_manager):
         """Test chunk splitting."""
         doc = create_large_test_document(5)
@@ -216,7 +485,46 @@ class TestChunkManager:
             new_chunks = chunk_manager.split_chunk(0, [5])
             assert len(new_chunks) == 2
             assert all(c.size > 0 for c in new_chunks)
-            
+
+    def test_split_chunk_cuts_elements(self, chunk_manager):
+        """Test that split points inside an element cut it at word boundaries."""
+        content = [
+            {"type": "heading", "text": "Intro", "level": 1, "position": 0},
+            {"type": "text", "text": "one two  three", "position": 1},
+            {"type": "heading", "text": "Next", "level": 2, "position": 2},
+            {"type": "text", "text": "four five", "position": 3},
+        ]
+        references = {"outgoing": [{"id": "b", "position": 3}, {"id": "a", "position": 1}]}
+        chunk_manager.chunks = [create_test_chunk(chunk_id="c0", content=content, references=references)]
+
+        first, second, third = chunk_manager.split_chunk(0, [2, 3])
+
+        assert [e.get("text") for e in first.content] == ["Intro", "one two"]
+        assert [e.get("text") for e in second.content] == ["three"]
+        assert [e.get("text") for e in third.content] == ["Next", "four five"]
+        assert [c.size for c in chunk_manager.chunks] == [2, 1, 2]
+        assert third.boundary.start_pos == 2
+        assert [r["id"] for r in first.boundary.references["outgoing"]] == ["a"]
+        assert [r["id"] for r in third.boundary.references["outgoing"]] == ["b"]
+
+        with pytest.raises(ValueError):
+            chunk_manager.split_chunk(0, [2])
+
+    def test_find_optimal_split_point(self, chunk_manager):
+        """Test that split points prefer headings near the middle."""
+        content = [
+            {"type": "heading", "text": "One", "level": 1, "position": 0},
+            {"type": "text", "text": "a b c d.", "position": 1},
+            {"type": "heading", "text": "Two", "level": 1, "position": 2},
+            {"type": "text", "text": "e f g h.", "position": 3},
+            {"type": "text", "text": "i j k l", "position": 4},
+        ]
+        boundary = ChunkBoundary(start_pos=0, end_pos=4, context={}, heading_stack=[], references={})
+        chunk = Chunk(content, boundary, ChunkMetadata("c0", 0))
+
+        assert chunk_manager._find_optimal_split_point(chunk) == 4
+        assert chunk_manager._find_optimal_split_point(Chunk(content[:2], boundary, ChunkMetadata("c1", 0))) is None
+
     def test_save_load_chunks(self, chunk_manager):
         """Test chunk serialization to/from files."""
         doc = create_test_document()
@@ -237,6 +545,91 @@ class TestChunkManager:
             for c1, c2 in zip(original_chunks, new_manager.chunks):
                 assert assert_chunks_equal(c1, c2)
                 
+    def test_save_replaces_only_own_output(self):
+        """Test that saving removes stale chunk files but leaves other files alone."""
+        manager = ChunkManager({"max_chunk_size": 50})
+        manager.chunk_document(create_large_test_document(6))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            save_dir = Path(tmpdir)
+            notes = save_dir / "chunk_notes.json"
+            notes.write_text("{}")
+            first = manager.save_chunks(save_dir)
+
+            manager.merge_chunks([0, 1])
+            second = manager.save_chunks(save_dir)
+
+            assert notes.exists()
+            assert not first[-1].exists()
+            assert sorted(save_dir.glob("chunk_0*")) == second
+
+            new_manager = ChunkManager({"strategy": "semantic"})
+            new_manager.load_chunks(save_dir)
+            assert len(new_manager.chunks) == len(manager.chunks)
+
+    def test_dir_save_keeps_foreign_archive(self):
+        """Test that a chunks.tar this manager did not write survives a save."""
+        manager = ChunkManager({"max_chunk_size": 50})
+        manager.chunk_document(create_large_test_document(6))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            save_dir = Path(tmpdir)
+            archive = save_dir / "chunks.tar"
+            archive.write_bytes(b"not ours")
+            manager.save_chunks(save_dir)
+
+            assert archive.read_bytes() == b"not ours"
+            new_manager = ChunkManager({"strategy": "semantic"})
+            new_manager.load_chunks(save_dir)
+            assert len(new_manager.chunks) == len(manager.chunks)
+
+    def test_save_load_json_parallel(self, monkeypatch):
+        """Test JSON serialization and loading in worker processes."""
+        import pipeline.core.chunking as chunking
+        monkeypatch.setattr(chunking, "_PARALLEL_LOAD_MIN_FILES", 1)
+        manager = ChunkManager({"max_chunk_size": 50, "serialization_format": "json"})
+        original_chunks = manager.chunk_document(create_large_test_document(6))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            saved_files = manager.save_chunks(Path(tmpdir))
+            assert all(path.suffix == ".json" for path in saved_files)
+
+            new_manager = ChunkManager({"strategy": "semantic"})
+            new_manager.load_chunks(Path(tmpdir))
+
+        assert len(new_manager.chunks) == len(original_chunks)
+        for c1, c2 in zip(original_chunks, new_manager.chunks):
+            assert assert_chunks_equal(c1, c2)
+
+    def test_save_load_tar_archive(self):
+        """Test saving chunks into a single archive and loading them back."""
+        manager = ChunkManager({"max_chunk_size": 50, "save_format": "tar"})
+        original_chunks = manager.chunk_document(create_large_test_document(6))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            saved_files = manager.save_chunks(Path(tmpdir))
+            assert [path.name for path in saved_files] == ["chunks.tar"]
+            assert not list(Path(tmpdir).glob("chunk_*"))
+
+            new_manager = ChunkManager({"strategy": "semantic"})
+            new_manager.load_chunks(Path(tmpdir))
+
+        assert len(new_manager.chunks) == len(original_chunks)
+        for c1, c2 in zip(original_chunks, new_manager.chunks):
+            assert assert_chunks_equal(c1, c2)
+
+    def test_extract_element_references(self, chunk_manager):
+        """Test that figure, table and section references are found in text order."""
+        refs = chunk_manager._extract_references(
+            {"type": "text", "text": "See Table 2, Fig. 1.3 and Section 4.1."}
+        )
+
+        assert refs == [
+            {"type": "table", "target": "2"},
+            {"type": "figure", "target": "1.3"},
+            {"type": "section", "target": "4.1"},
+        ]
+
     def test_analyze_coherence(self, chunk_manager):
         """Test chunk coherence analysis."""
         doc = create_large_test_document(6)
@@ -245,7 +638,23 @@ class TestChunkManager:
         if len(chunks) >= 2:
             score = chunk_manager.analyze_coherence([0, 1])
             assert 0.0 <= score <= 1.0
-            
+
+    def test_coherence_scores(self, chunk_manager):
+        """Test coherence from topic overlap and resolved references."""
+        chunks = [create_test_chunk(f"c{i}") for i in range(3)]
+        for chunk, topics in zip(chunks, (["a", "b"], ["b", "c"], ["b", "c"])):
+            chunk.boundary.context = {"topics": topics}
+        chunks[0].boundary.references = {"outgoing": [{"target": "fig1"}]}
+        chunks[1].boundary.references = {"internal": [{"id": "fig1"}]}
+        chunk_manager.chunks = chunks
+
+        assert chunk_manager.analyze_coherence([1, 2]) == 1.0
+        # Topic overlap of 1/3, with the only outgoing reference resolved
+        assert chunk_manager.analyze_coherence([0, 1]) == 1.0
+        chunks[1].boundary.references = {}
+        assert chunk_manager.analyze_coherence([0, 1]) == pytest.approx(1 / 3)
+        assert chunk_manager.analyze_coherence() == pytest.approx(2 / 3)
+
     def test_error_handling(self, chunk_manager):
         """Test error handling in chunk manager."""
         with pytest.raises(ChunkingError):
@@ -280,12 +689,22 @@ class TestPatternRegistry:
         assert "test" in scores
         assert scores["test"] > 0
 
+    def test_default_line_patterns(self):
+        """Test default page number and line-anchored section patterns."""
+        registry = PatternRegistry()
+        scores = registry.evaluate_block("Some text\n42\nAppendix A\nAPPENDIX B\nReferences")
+        assert "page_number" in scores
+        assert scores["appendix"] == 2 * scores["bibliography"]
+
 class TestContentPatternDetector:
     def test_chapter_boundary_detection(self):
         """Test chapter boundary detection."""
         detector = ContentPatternDetector()
         assert detector.detect_chapter_boundary("Chapter 1: Introduction")
         assert not detector.detect_chapter_boundary("Regular paragraph text")
+        # Repeat checks are answered from the per-text cache
+        assert detector.detect_chapter_boundary("Chapter 1: Introduction")
+        assert len(detector._chapter_cache) == 2
         
     def test_section_type_detection(self):
         """Test section type detection."""
@@ -293,4 +712,65 @@ class TestContentPatternDetector:
         text = "Table of Contents"
         position = 0.05  # Near start of document
         section_type = detector.detect_section_type(text, position)
-        assert section_type.name == "FRONT_MATTER"
\ No newline at end of file
+        assert section_type.name == "FRONT_MATTER"
+        # Front and back matter are only recognised by their headings
+        assert detector.detect_section_type("The contents of the box", position).name == "MAIN_CONTENT"
+        assert detector.detect_section_type("Glossary\nTerm: meaning", 0.95).name == "BACK_MATTER"
+        assert detector.detect_section_type("It references earlier work.", 0.95).name == "MAIN_CONTENT"
+
+    def test_section_type_priority(self):
+        """Test that the highest-priority section marker wins."""
+        detector = ContentPatternDetector()
+        assert detector.detect_section_type("Appendix B\nTables").name == "APPENDIX"
+        assert detector.detect_section_type("Index\nAll rights reserved.").name == "COPYRIGHT"
+        assert detector.detect_section_type("Indexing is covered later.").name == "MAIN_CONTENT"
+
+    def test_non_content_detection(self):
+        """Test detection of boilerplate text blocks."""
+        detector = ContentPatternDetector()
+        assert detector.detect_non_content("Copyright 2020. All rights reserved.")
+        assert detector.detect_non_content("Page 3 of 10")
+        assert detector.detect_non_content("  42 ")
+        assert not detector.detect_non_content("The story begins on a cold morning.")
+
+    def test_content_density_cached(self):
+        """Test content density metrics and their per-text cache."""
+        detector = ContentPatternDetector()
+        text = "One short sentence. Another one here!"
+        density = detector.analyze_content_density(text)
+        assert density["word_count"] == 6
+        assert density["sentence_count"] == 2
+        assert density["avg_sentence_length"] == 3.0
+
+        density["word_count"] = 0
+        assert detector.analyze_content_density(text)["word_count"] == 6
+        assert len(detector._density_cache) == 1
+
+    def test_detector_cache_bounded_by_text_size(self, monkeypatch):
+        """Test that result caches evict the oldest texts past their size budget."""
+        monkeypatch.setattr("pipeline.core.chunking._DETECTOR_CACHE_CHARS", 25)
+        detector = ContentPatternDetector()
+        for text in ("Chapter 1 opens", "Chapter 2 opens", "x" * 30):
+            detector.detect_chapter_boundary(text)
+
+        assert len(detector._chapter_cache) == 1
+        assert detector._chapter_cache.get("Chapter 2 opens") is not None
+
+    def test_section_structure_detection(self):
+        """Test heading and list extraction from a text block."""
+        detector = ContentPatternDetector()
+        text = "Chapter 2: Tools\n- one\n- two\nSome text\n1. first\n2. second\n* lone\n2.1 Details"
+        structure = detector.detect_section_structure(text)
+        assert structure["headings"] == ["Chapter 2: Tools", "2.1 Details"]
+        assert structure["lists"] == [["one", "two"], ["first", "second", "lone"]]
+
+    def test_narrative_flow(self):
+        """Test narrative flow scoring across chunk boundaries."""
+        detector = ContentPatternDetector()
+        assert detector.detect_narrative_flow(["Only one chunk."]) == 1.0
+
+        flowing = ["The garden grew quietly.", "The garden grew again."]
+        broken = ["The garden grew quietly and", "Markets rallied sharply today."]
+        # Sentence ends (0.5) plus half of a 2-of-4 term overlap (0.25)
+        assert detector.detect_narrative_flow(flowing) == 0.75
+        assert detector.detect_narrative_flow(broken) == 0.0
@@ -203,44 +203,63 @@ def create_large_test_document(num_paragraphs: int = 10) -> DocumentModel:
         content=content  # Use the raw content list instead of TextElement objects
     )
 
-def create_test_chunk(id_prefix="test_chunk") -> Chunk:
+def create_test_chunk(id_prefix="test_chunk",
+                      chunk_id: Optional[str] = None,
+                      texts: Optional[List[str]] = None,
+                      content: Optional[List[Dict[str, Any]]] = None,
+                      start_pos: int = 0,
+                      size: Optional[int] = None,
+                      references: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Chunk:
     """Create a test chunk for unit tests.
     
     Args:
         id_prefix: Prefix for the chunk ID
+        chunk_id: Exact chunk ID, overriding the prefixed default
+        texts: Texts of consecutive text elements to use as content
+        content: Content elements, used when no texts are given
+        start_pos: Position of the first text element
+        size: Explicit chunk size
+        references: Boundary references
         
     Returns:
         A test chunk
     """
-    content = [
-        {
-            "type": "text",
-            "text": "Test content",
-            "position": 0
-        },
-        {
-            "type": "paragraph",
-            "text": "Additional content",
-            "position": 1
-        }
-    ]
+    if texts is not None:
+        content = [
+            {"type": "text", "text": text, "position": start_pos + offset}
+            for offset, text in enumerate(texts)
+        ]
     
     metadata = ChunkMetadata(
-        chunk_id=f"{id_prefix}_001",  # Fixed ID for testing
+        chunk_id=chunk_id or f"{id_prefix}_001",  # Fixed ID for testing
         sequence_num=0,
         section_title="Test Section"
     )
-    metadata.word_count = 2  # Explicitly set to match the test expectation
+    
+    if content is None:
+        content = [
+            {
+                "type": "text",
+                "text": "Test content",
+                "position": 0
+            },
+            {
+                "type": "paragraph",
+                "text": "Additional content",
+                "position": 1
+            }
+        ]
+        metadata.word_count = 2  # Explicitly set to match the test expectation
     
     boundary = ChunkBoundary(
-        start_pos=0,
-        end_pos=1,
+        start_pos=content[0].get("position", 0) if content else 0,
+        end_pos=content[-1].get("position", 0) if content else 0,
         context={},
         heading_stack=[],
-        references={}
+        references=references if references is not None else {}
     )
     
-    return Chunk(content, boundary, metadata)
+    return Chunk(content, boundary, metadata, _size=size)
 
 def assert_chunks_equal(chunk1: Chunk, chunk2: Chunk) -> bool:
     """Assert that two chunks are equal by comparing their components."""